@@ -5,7 +5,18 @@ Validates all modules, functions, and features are properly implemented.
 """
 
 import ast
+import fnmatch
+import hashlib
+import io
+import json
+import mmap
+import os
+import re
 import sys
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
@@ -16,37 +27,161 @@ YELLOW = "\033[1;33m"
 BLUE = "\033[0;34m"
 NC = "\033[0m"  # No Color
 
+# Marker left in commands that are still stubs
+_NOT_IMPLEMENTED_RE = re.compile(rb"not yet fully implemented", re.IGNORECASE)
+
+
+class _PhaseResult:
+    """Output and results collected by a validation phase."""
+
+    __slots__ = ("buf", "issues", "success_count")
+
+    def __init__(self) -> None:
+        self.buf = io.StringIO()
+        self.issues: list[str] = []
+        self.success_count = 0
+
 
 class ProjectValidator:
     """Validates project completeness."""
 
+    __slots__ = (
+        "root",
+        "src",
+        "tests",
+        "_result",
+        "_ast_cache",
+        "_top_level_names",
+        "_dir_cache",
+        "_root_dir",
+        "_src_dir",
+        "_tests_dir",
+        "_local",
+        "_cache_dir",
+    )
+
     def __init__(self):
         self.root = Path(__file__).parent.parent
         self.src = self.root / "src" / "csv2pg_ai_schema_infer"
         self.tests = self.root / "tests"
-        self.issues = []
-        self.successes = []
+        self._result = _PhaseResult()
+        self._ast_cache: dict[Path, ast.Module] = {}
+        self._top_level_names: dict[Path, tuple[set[str], set[str]]] = {}
+        self._dir_cache: dict[str, set[str]] = {}
+        # Plain string directories keep Path objects out of the file checks
+        self._root_dir = str(self.root)
+        self._src_dir = str(self.src)
+        self._tests_dir = str(self.tests)
+        self._local = threading.local()
+        self._cache_dir = self.root / ".cache" / "csv2pg-validator"
+
+    @property
+    def issues(self) -> list[str]:
+        """Messages of failed checks."""
+        return self._result.issues
+
+    @property
+    def success_count(self) -> int:
+        """Number of passed checks."""
+        return self._result.success_count
+
+    def _current(self) -> _PhaseResult:
+        """Return the result collector for the running phase."""
+        return getattr(self._local, "result", None) or self._result
+
+    def _emit(self, line: str) -> None:
+        """Buffer a line of output until the run is finished."""
+        buf = self._current().buf
+        buf.write(line)
+        buf.write("\n")
+
+    def flush_output(self) -> None:
+        """Write all buffered output to stdout in one go."""
+        sys.stdout.write(self._result.buf.getvalue())
+        sys.stdout.flush()
+        self._result.buf = io.StringIO()
 
     def check(self, condition: bool, message: str) -> None:
         """Check a condition and record result."""
+        result = self._current()
         if condition:
-            self.successes.append(message)
-            print(f"{GREEN}✓{NC} {message}")
+            result.success_count += 1
+            self._emit(f"{GREEN}✓{NC} {message}")
         else:
-            self.issues.append(message)
-            print(f"{RED}✗{NC} {message}")
-
-    def check_file_exists(self, path: Path, description: str) -> bool:
-        """Check if a file exists."""
-        exists = path.exists()
-        self.check(exists, f"{description}: {path.relative_to(self.root)}")
+            result.issues.append(message)
+            self._emit(f"{RED}✗{NC} {message}")
+
+    def _listdir(self, directory: str) -> set[str]:
+        """List a directory once and cache its entry names."""
+        entries = self._dir_cache.get(directory)
+        if entries is None:
+            try:
+                with os.scandir(directory) as it:
+                    entries = {entry.name for entry in it}
+            except OSError:
+                entries = set()
+            self._dir_cache[directory] = entries
+        return entries
+
+    def _exists(self, path: Path) -> bool:
+        """Check if a path exists using the cached directory listing."""
+        return path.name in self._listdir(str(path.parent))
+
+    def check_file_exists(self, directory: str, filename: str, description: str) -> bool:
+        """Check if a file exists in a directory."""
+        exists = filename in self._listdir(directory)
+        relative = os.path.relpath(os.path.join(directory, filename), self._root_dir)
+        self.check(exists, f"{description}: {relative}")
         return exists
 
+    def _get_tree(self, module_path: Path) -> ast.Module:
+        """Parse a module once and reuse the AST for later lookups."""
+        tree = self._ast_cache.get(module_path)
+        if tree is None:
+            tree = ast.parse(module_path.read_text())
+            self._ast_cache[module_path] = tree
+        return tree
+
+    def _get_top_level_names(self, module_path: Path) -> tuple[set[str], set[str]]:
+        """Collect top-level function and class names of a module."""
+        names = self._top_level_names.get(module_path)
+        if names is None:
+            names = self._load_cached_names(module_path)
+            self._top_level_names[module_path] = names
+        return names
+
+    def _load_cached_names(self, module_path: Path) -> tuple[set[str], set[str]]:
+        """Load top-level names from the on-disk cache, parsing on a miss."""
+        source = module_path.read_bytes()
+        key = hashlib.sha256(source)
+        key.update(f"{sys.version_info.major}.{sys.version_info.minor}".encode())
+        cache_file = self._cache_dir / f"{key.hexdigest()}.json"
+
+        try:
+            cached = json.loads(cache_file.read_text())
+            return set(cached["functions"]), set(cached["classes"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        tree = ast.parse(source, filename=str(module_path))
+        self._ast_cache[module_path] = tree
+        functions = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+        classes = {node.name for node in tree.body if isinstance(node, ast.ClassDef)}
+
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                json.dumps({"functions": sorted(functions), "classes": sorted(classes)})
+            )
+        except OSError:
+            pass
+
+        return functions, classes
+
     def check_module_imports(self, module_path: Path) -> bool:
         """Check if a Python module has valid imports."""
         try:
-            with open(module_path) as f:
-                ast.parse(f.read())
+            self._get_tree(module_path)
             return True
         except SyntaxError:
             return False
@@ -54,32 +189,22 @@ class ProjectValidator:
     def check_function_exists(self, module_path: Path, function_name: str) -> bool:
         """Check if a function exists in a module."""
         try:
-            with open(module_path) as f:
-                tree = ast.parse(f.read())
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and node.name == function_name:
-                    return True
-            return False
+            functions, _ = self._get_top_level_names(module_path)
+            return function_name in functions
         except Exception:
             return False
 
     def check_class_exists(self, module_path: Path, class_name: str) -> bool:
         """Check if a class exists in a module."""
         try:
-            with open(module_path) as f:
-                tree = ast.parse(f.read())
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and node.name == class_name:
-                    return True
-            return False
+            _, classes = self._get_top_level_names(module_path)
+            return class_name in classes
         except Exception:
             return False
 
     def validate_core_modules(self) -> None:
         """Validate all core modules exist."""
-        print(f"\n{BLUE}Checking Core Modules...{NC}")
+        self._emit(f"\n{BLUE}Checking Core Modules...{NC}")
 
         modules = [
             ("cli.py", "CLI interface"),
@@ -93,79 +218,82 @@ class ProjectValidator:
         ]
 
         for filename, desc in modules:
-            path = self.src / filename
-            self.check_file_exists(path, desc)
+            self.check_file_exists(self._src_dir, filename, desc)
 
     def validate_llm_modules(self) -> None:
         """Validate LLM provider modules."""
-        print(f"\n{BLUE}Checking LLM Modules...{NC}")
+        self._emit(f"\n{BLUE}Checking LLM Modules...{NC}")
 
-        llm_dir = self.src / "llm"
-        self.check_file_exists(llm_dir / "__init__.py", "LLM package init")
-        self.check_file_exists(llm_dir / "base.py", "LLM base interface")
-        self.check_file_exists(llm_dir / "gemini.py", "Gemini provider")
+        llm_dir = os.path.join(self._src_dir, "llm")
+        self.check_file_exists(llm_dir, "__init__.py", "LLM package init")
+        has_base = self.check_file_exists(llm_dir, "base.py", "LLM base interface")
+        has_gemini_module = self.check_file_exists(llm_dir, "gemini.py", "Gemini provider")
 
         # Check for required classes
-        if (llm_dir / "base.py").exists():
-            has_provider = self.check_class_exists(llm_dir / "base.py", "LLMProvider")
+        if has_base:
+            has_provider = self.check_class_exists(self.src / "llm" / "base.py", "LLMProvider")
             self.check(has_provider, "LLMProvider class exists")
 
-        if (llm_dir / "gemini.py").exists():
-            has_gemini = self.check_class_exists(llm_dir / "gemini.py", "GeminiProvider")
+        if has_gemini_module:
+            has_gemini = self.check_class_exists(
+                self.src / "llm" / "gemini.py", "GeminiProvider"
+            )
             self.check(has_gemini, "GeminiProvider class exists")
 
     def validate_utils(self) -> None:
         """Validate utility modules."""
-        print(f"\n{BLUE}Checking Utility Modules...{NC}")
+        self._emit(f"\n{BLUE}Checking Utility Modules...{NC}")
 
-        utils_dir = self.src / "utils"
-        self.check_file_exists(utils_dir / "__init__.py", "Utils package init")
-        self.check_file_exists(utils_dir / "logger.py", "Logger utility")
-        self.check_file_exists(utils_dir / "validation.py", "Validation utility")
+        utils_dir = os.path.join(self._src_dir, "utils")
+        self.check_file_exists(utils_dir, "__init__.py", "Utils package init")
+        self.check_file_exists(utils_dir, "logger.py", "Logger utility")
+        self.check_file_exists(utils_dir, "validation.py", "Validation utility")
 
     def validate_templates(self) -> None:
         """Validate template files."""
-        print(f"\n{BLUE}Checking Templates...{NC}")
+        self._emit(f"\n{BLUE}Checking Templates...{NC}")
 
-        templates_dir = self.src / "templates"
-        self.check_file_exists(templates_dir / "pgloader.jinja2", "pgloader template")
+        templates_dir = os.path.join(self._src_dir, "templates")
+        self.check_file_exists(templates_dir, "pgloader.jinja2", "pgloader template")
         self.check_file_exists(
-            templates_dir / "import.sh.jinja2", "Import script template"
+            templates_dir, "import.sh.jinja2", "Import script template"
         )
 
     def validate_tests(self) -> None:
         """Validate test structure."""
-        print(f"\n{BLUE}Checking Test Structure...{NC}")
+        self._emit(f"\n{BLUE}Checking Test Structure...{NC}")
 
-        self.check_file_exists(self.tests / "conftest.py", "Test fixtures")
-        self.check_file_exists(self.tests / "unit" / "test_config.py", "Config tests")
-        self.check_file_exists(self.tests / "unit" / "test_sampler.py", "Sampler tests")
-        self.check_file_exists(self.tests / "unit" / "test_chunker.py", "Chunker tests")
+        unit_dir = os.path.join(self._tests_dir, "unit")
+        self.check_file_exists(self._tests_dir, "conftest.py", "Test fixtures")
+        self.check_file_exists(unit_dir, "test_config.py", "Config tests")
+        self.check_file_exists(unit_dir, "test_sampler.py", "Sampler tests")
+        self.check_file_exists(unit_dir, "test_chunker.py", "Chunker tests")
 
     def validate_config_files(self) -> None:
         """Validate configuration files."""
-        print(f"\n{BLUE}Checking Configuration Files...{NC}")
+        self._emit(f"\n{BLUE}Checking Configuration Files...{NC}")
 
-        self.check_file_exists(self.root / "pyproject.toml", "Project metadata")
-        self.check_file_exists(self.root / "config" / "default.yaml", "Default config")
-        self.check_file_exists(self.root / ".env.template", "Environment template")
-        self.check_file_exists(self.root / ".gitignore", "Git ignore file")
+        config_dir = os.path.join(self._root_dir, "config")
+        self.check_file_exists(self._root_dir, "pyproject.toml", "Project metadata")
+        self.check_file_exists(config_dir, "default.yaml", "Default config")
+        self.check_file_exists(self._root_dir, ".env.template", "Environment template")
+        self.check_file_exists(self._root_dir, ".gitignore", "Git ignore file")
 
     def validate_ci_cd(self) -> None:
         """Validate CI/CD configuration."""
-        print(f"\n{BLUE}Checking CI/CD Configuration...{NC}")
+        self._emit(f"\n{BLUE}Checking CI/CD Configuration...{NC}")
 
-        workflows = self.root / ".github" / "workflows"
-        self.check_file_exists(workflows / "ci.yml", "CI workflow")
-        self.check_file_exists(workflows / "release.yml", "Release workflow")
-        self.check_file_exists(workflows / "codeql.yml", "CodeQL workflow")
+        workflows = os.path.join(self._root_dir, ".github", "workflows")
+        self.check_file_exists(workflows, "ci.yml", "CI workflow")
+        self.check_file_exists(workflows, "release.yml", "Release workflow")
+        self.check_file_exists(workflows, "codeql.yml", "CodeQL workflow")
         self.check_file_exists(
-            self.root / ".pre-commit-config.yaml", "Pre-commit config"
+            self._root_dir, ".pre-commit-config.yaml", "Pre-commit config"
         )
 
     def validate_documentation(self) -> None:
         """Validate documentation files."""
-        print(f"\n{BLUE}Checking Documentation...{NC}")
+        self._emit(f"\n{BLUE}Checking Documentation...{NC}")
 
         docs = [
             ("README.md", "Main README"),
@@ -177,11 +305,11 @@ class ProjectValidator:
         ]
 
         for filename, desc in docs:
-            self.check_file_exists(self.root / filename, desc)
+            self.check_file_exists(self._root_dir, filename, desc)
 
     def validate_key_functions(self) -> None:
         """Validate key functions exist in modules."""
-        print(f"\n{BLUE}Checking Key Functions...{NC}")
+        self._emit(f"\n{BLUE}Checking Key Functions...{NC}")
 
         checks = [
             (self.src / "sampler.py", "sample_csv", "CSV sampling function"),
@@ -197,74 +325,111 @@ class ProjectValidator:
             (self.src / "config.py", "load_config", "Config loading function"),
         ]
 
+        # Group checks so each module is inspected in a single pass
+        checks_by_module: defaultdict[Path, list[tuple[str, str]]] = defaultdict(list)
         for module_path, func_name, desc in checks:
-            if module_path.exists():
-                has_func = self.check_function_exists(module_path, func_name)
-                self.check(has_func, desc)
+            checks_by_module[module_path].append((func_name, desc))
+
+        for module_path, module_checks in checks_by_module.items():
+            if not self._exists(module_path):
+                continue
+            try:
+                top_funcs, _ = self._get_top_level_names(module_path)
+            except Exception:
+                top_funcs = set()
+            for func_name, desc in module_checks:
+                self.check(func_name in top_funcs, desc)
 
     def check_missing_features(self) -> None:
         """Check for known missing or incomplete features."""
-        print(f"\n{BLUE}Checking for Known Gaps...{NC}")
+        self._emit(f"\n{BLUE}Checking for Known Gaps...{NC}")
 
-        # Check for integration tests
-        integration_dir = self.tests / "integration"
-        has_integration = integration_dir.exists() and any(
-            integration_dir.glob("test_*.py")
+        # Check for integration tests (a missing directory lists as empty)
+        integration_dir = os.path.join(self._tests_dir, "integration")
+        has_integration = bool(
+            fnmatch.filter(self._listdir(integration_dir), "test_*.py")
         )
         self.check(has_integration, "Integration tests implemented (optional)")
 
         # Check for performance tests
-        performance_dir = self.tests / "performance"
-        has_performance = performance_dir.exists() and any(
-            performance_dir.glob("test_*.py")
+        performance_dir = os.path.join(self._tests_dir, "performance")
+        has_performance = bool(
+            fnmatch.filter(self._listdir(performance_dir), "test_*.py")
         )
         self.check(has_performance, "Performance tests implemented (optional)")
 
         # Check for resume implementation
-        if (self.src / "cli.py").exists():
-            with open(self.src / "cli.py") as f:
-                content = f.read()
-                has_full_resume = "not yet fully implemented" not in content.lower()
-                self.check(has_full_resume, "Resume command fully implemented (optional)")
+        if self._exists(self.src / "cli.py"):
+            with open(self.src / "cli.py", "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    # An empty file can't be mapped, and has no resume command
+                    has_full_resume = False
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        has_full_resume = _NOT_IMPLEMENTED_RE.search(mm) is None
+            self.check(has_full_resume, "Resume command fully implemented (optional)")
+
+    def _run_phase(self, phase: Callable[[], None]) -> _PhaseResult:
+        """Run a validation phase with its own result collector."""
+        result = _PhaseResult()
+        self._local.result = result
+        try:
+            phase()
+        finally:
+            del self._local.result
+        return result
 
     def run_validation(self) -> int:
         """Run all validations."""
-        print(f"{BLUE}{'=' * 60}{NC}")
-        print(f"{BLUE}CSV2PG AI Schema Infer - Completeness Check{NC}")
-        print(f"{BLUE}{'=' * 60}{NC}")
-
-        self.validate_core_modules()
-        self.validate_llm_modules()
-        self.validate_utils()
-        self.validate_templates()
-        self.validate_tests()
-        self.validate_config_files()
-        self.validate_ci_cd()
-        self.validate_documentation()
-        self.validate_key_functions()
-        self.check_missing_features()
-
-        print(f"\n{BLUE}{'=' * 60}{NC}")
-        print(f"{GREEN}Successes: {len(self.successes)}{NC}")
-        print(f"{RED}Issues: {len(self.issues)}{NC}")
-        print(f"{BLUE}{'=' * 60}{NC}")
+        self._emit(f"{BLUE}{'=' * 60}{NC}")
+        self._emit(f"{BLUE}CSV2PG AI Schema Infer - Completeness Check{NC}")
+        self._emit(f"{BLUE}{'=' * 60}{NC}")
+
+        phases = [
+            self.validate_core_modules,
+            self.validate_llm_modules,
+            self.validate_utils,
+            self.validate_templates,
+            self.validate_tests,
+            self.validate_config_files,
+            self.validate_ci_cd,
+            self.validate_documentation,
+            self.validate_key_functions,
+            self.check_missing_features,
+        ]
+
+        # Phases only stat and read files, so they overlap well in threads.
+        # Results are merged in phase order to keep the report stable.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self._run_phase, phases))
+
+        for result in results:
+            self._result.buf.write(result.buf.getvalue())
+            self._result.issues.extend(result.issues)
+            self._result.success_count += result.success_count
+
+        self._emit(f"\n{BLUE}{'=' * 60}{NC}")
+        self._emit(f"{GREEN}Successes: {self.success_count}{NC}")
+        self._emit(f"{RED}Issues: {len(self.issues)}{NC}")
+        self._emit(f"{BLUE}{'=' * 60}{NC}")
 
         if self.issues:
-            print(f"\n{YELLOW}Issues Found:{NC}")
+            self._emit(f"\n{YELLOW}Issues Found:{NC}")
             for issue in self.issues:
-                print(f"  - {issue}")
+                self._emit(f"  - {issue}")
 
         if len(self.issues) == 0:
-            print(f"\n{GREEN}✓ All checks passed! Project is complete.{NC}")
-            return 0
+            self._emit(f"\n{GREEN}✓ All checks passed! Project is complete.{NC}")
+            exit_code = 0
         elif len(self.issues) <= 3:
-            print(
-                f"\n{YELLOW}⚠ Minor issues found. Project is mostly complete.{NC}"
-            )
-            return 0
+            self._emit(f"\n{YELLOW}⚠ Minor issues found. Project is mostly complete.{NC}")
+            exit_code = 0
         else:
-            print(f"\n{RED}✗ Significant issues found. Review required.{NC}")
-            return 1
+            self._emit(f"\n{RED}✗ Significant issues found. Review required.{NC}")
+            exit_code = 1
+
+        self.flush_output()
+        return exit_code
 
 
 if __name__ == "__main__":
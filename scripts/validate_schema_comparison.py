@@ -9,19 +9,64 @@ This script:
 4. Outputs a human-readable comparison report
 """
 
+import functools
+import itertools
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, TextIO, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-from csv2pg_ai_schema_infer.config import Config
-from csv2pg_ai_schema_infer.llm.gemini import GeminiProvider
-from csv2pg_ai_schema_infer.sampler import sample_csv
-from csv2pg_ai_schema_infer.inference import infer_schema_sync
+# Patterns are compiled once; the helpers below run for every column
+_CREATE_RE = re.compile(
+    r'\$\$ CREATE TABLE \w+ \((.*?)\); \$\$',
+    re.DOTALL | re.MULTILINE
+)
+_COLUMN_RE = re.compile(
+    r'^\s*(\w+)\s+((?:(?:var)?char|text|integer|bigint|numeric|date|uuid|timestamptz|boolean)(?:\([^)]+\))?)',
+    re.MULTILINE | re.IGNORECASE
+)
+_PAREN_RE = re.compile(r'\([^)]+\)')
+
+# Common PostgreSQL type aliases and their canonical names
+_TYPE_ALIASES = {
+    'timestamp with time zone': 'timestamptz',
+    'timestamp without time zone': 'timestamp',
+    'int': 'integer',
+    'int4': 'integer',
+    'int8': 'bigint',
+    'float8': 'double precision',
+    'float4': 'real',
+    'bool': 'boolean',
+}
+
+# Type families treated as compatible in comparisons
+_NUMERIC_TYPES = frozenset({'integer', 'bigint', 'numeric', 'real', 'double precision'})
+_INT_TYPES = frozenset({'integer', 'bigint'})
+_DEC_TYPES = frozenset({'numeric', 'real', 'double precision'})
+_TEXT_TYPES = frozenset({'text', 'varchar', 'character varying'})
+
+
+def _build_compat_table() -> dict[tuple[str, str], tuple[bool, str]]:
+    """Precompute results for every compatible pair of distinct known types."""
+    table = {}
+    for a, b in itertools.product(_NUMERIC_TYPES | _TEXT_TYPES, repeat=2):
+        if a == b:
+            continue
+        if a in _INT_TYPES and b in _INT_TYPES:
+            table[a, b] = (True, "Compatible integer types")
+        elif a in _DEC_TYPES and b in _DEC_TYPES:
+            table[a, b] = (True, "Compatible decimal types")
+        elif a in _TEXT_TYPES and b in _TEXT_TYPES:
+            table[a, b] = (True, "Compatible text types")
+    return table
+
+
+# (inferred, reference) -> (is_match, reason) for compatible type pairs
+_COMPAT = _build_compat_table()
 
 
 def parse_pgloader_schema(pgloader_file: Path) -> Dict[str, str]:
@@ -35,11 +80,7 @@ def parse_pgloader_schema(pgloader_file: Path) -> Dict[str, str]:
         content = f.read()
 
     # Extract the CREATE TABLE section
-    create_table_match = re.search(
-        r'\$\$ CREATE TABLE \w+ \((.*?)\); \$\$',
-        content,
-        re.DOTALL | re.MULTILINE
-    )
+    create_table_match = _CREATE_RE.search(content)
 
     if not create_table_match:
         raise ValueError("Could not find CREATE TABLE statement in pgloader file")
@@ -47,13 +88,8 @@ def parse_pgloader_schema(pgloader_file: Path) -> Dict[str, str]:
     table_def = create_table_match.group(1)
 
     # Parse column definitions
-    column_pattern = re.compile(
-        r'^\s*(\w+)\s+((?:(?:var)?char|text|integer|bigint|numeric|date|uuid|timestamptz|boolean)(?:\([^)]+\))?)',
-        re.MULTILINE | re.IGNORECASE
-    )
-
     columns = {}
-    for match in column_pattern.finditer(table_def):
+    for match in _COLUMN_RE.finditer(table_def):
         col_name = match.group(1).strip().lower()
         col_type = match.group(2).strip().lower()
         columns[col_name] = col_type
@@ -61,6 +97,7 @@ def parse_pgloader_schema(pgloader_file: Path) -> Dict[str, str]:
     return columns
 
 
+@functools.lru_cache(maxsize=256)
 def normalize_type(pg_type: str) -> str:
     """
     Normalize PostgreSQL type for comparison.
@@ -73,21 +110,11 @@ def normalize_type(pg_type: str) -> str:
     pg_type = pg_type.lower().strip()
 
     # Remove precision/scale specifications
-    pg_type = re.sub(r'\([^)]+\)', '', pg_type)
+    pg_type = _PAREN_RE.sub('', pg_type)
 
     # Normalize common aliases
-    type_aliases = {
-        'timestamp with time zone': 'timestamptz',
-        'timestamp without time zone': 'timestamp',
-        'int': 'integer',
-        'int4': 'integer',
-        'int8': 'bigint',
-        'float8': 'double precision',
-        'float4': 'real',
-        'bool': 'boolean',
-    }
-
-    return type_aliases.get(pg_type.strip(), pg_type.strip())
+    pg_type = pg_type.strip()
+    return _TYPE_ALIASES.get(pg_type, pg_type)
 
 
 def compare_types(inferred_type: str, reference_type: str) -> Tuple[bool, str]:
@@ -104,23 +131,25 @@ def compare_types(inferred_type: str, reference_type: str) -> Tuple[bool, str]:
     if norm_inferred == norm_reference:
         return True, "Exact match"
 
-    # Compatible numeric types
-    numeric_types = {'integer', 'bigint', 'numeric', 'real', 'double precision'}
-    if norm_inferred in numeric_types and norm_reference in numeric_types:
-        # Allow some flexibility in numeric types
-        if {norm_inferred, norm_reference} <= {'integer', 'bigint'}:
-            return True, "Compatible integer types"
-        if {norm_inferred, norm_reference} <= {'numeric', 'real', 'double precision'}:
-            return True, "Compatible decimal types"
-
-    # Text types are generally compatible
-    text_types = {'text', 'varchar', 'character varying'}
-    if norm_inferred in text_types and norm_reference in text_types:
-        return True, "Compatible text types"
+    # Compatible numeric and text types
+    compat = _COMPAT.get((norm_inferred, norm_reference))
+    if compat is not None:
+        return compat
 
     return False, f"Type mismatch: {inferred_type} vs {reference_type}"
 
 
+class _TeeWriter:
+    """Write text to several streams at once."""
+
+    def __init__(self, *streams: TextIO):
+        self.streams = streams
+
+    def write(self, text: str) -> None:
+        for stream in self.streams:
+            stream.write(text)
+
+
 def generate_comparison_report(
     inferred_schema: Dict[str, str],
     reference_schema: Dict[str, str],
@@ -129,78 +158,91 @@ def generate_comparison_report(
     """
     Generate a human-readable comparison report.
 
+    The report is streamed to both a temporary file and the console as it is
+    produced; the temporary file replaces the output file only once the whole
+    report has been written.
+
     Returns:
         (matches, mismatches, missing)
     """
-    all_columns = set(inferred_schema.keys()) | set(reference_schema.keys())
+    all_columns = sorted(inferred_schema.keys() | reference_schema.keys())
 
     matches = 0
     mismatches = 0
     missing = 0
 
-    lines = []
-    lines.append("=" * 100)
-    lines.append("SCHEMA COMPARISON REPORT: Gemini AI vs Reference")
-    lines.append("=" * 100)
-    lines.append("")
-
-    # Sort columns alphabetically for easier reading
-    for col_name in sorted(all_columns):
-        inferred_type = inferred_schema.get(col_name)
-        reference_type = reference_schema.get(col_name)
-
-        if inferred_type is None:
-            lines.append(f"❌ MISSING: {col_name}")
-            lines.append(f"   Reference: {reference_type}")
-            lines.append(f"   Inferred:  NOT FOUND")
-            lines.append("")
-            missing += 1
-        elif reference_type is None:
-            lines.append(f"⚠️  EXTRA: {col_name}")
-            lines.append(f"   Reference: NOT IN REFERENCE")
-            lines.append(f"   Inferred:  {inferred_type}")
-            lines.append("")
-            missing += 1
-        else:
-            is_match, reason = compare_types(inferred_type, reference_type)
-
-            if is_match:
-                lines.append(f"✅ MATCH: {col_name}")
-                lines.append(f"   Reference: {reference_type}")
-                lines.append(f"   Inferred:  {inferred_type}")
-                lines.append(f"   Reason:    {reason}")
-                lines.append("")
-                matches += 1
-            else:
-                lines.append(f"❌ MISMATCH: {col_name}")
-                lines.append(f"   Reference: {reference_type}")
-                lines.append(f"   Inferred:  {inferred_type}")
-                lines.append(f"   Reason:    {reason}")
-                lines.append("")
-                mismatches += 1
-
-    # Summary
-    lines.append("=" * 100)
-    lines.append("SUMMARY")
-    lines.append("=" * 100)
-    lines.append(f"Total Columns:   {len(all_columns)}")
-    lines.append(f"✅ Matches:      {matches} ({matches/len(all_columns)*100:.1f}%)")
-    lines.append(f"❌ Mismatches:   {mismatches} ({mismatches/len(all_columns)*100:.1f}%)")
-    lines.append(f"⚠️  Missing:      {missing} ({missing/len(all_columns)*100:.1f}%)")
-    lines.append("=" * 100)
-
-    # Write to file
-    report_content = "\n".join(lines)
-    output_file.write_text(report_content)
-
-    # Also print to console
-    print(report_content)
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    try:
+        with tmp_file.open('w') as f:
+            tee = _TeeWriter(f, sys.stdout)
+            tee.write("=" * 100 + "\n")
+            tee.write("SCHEMA COMPARISON REPORT: Gemini AI vs Reference\n")
+            tee.write("=" * 100 + "\n")
+            tee.write("\n")
+
+            # Sort columns alphabetically for easier reading
+            for col_name in all_columns:
+                inferred_type = inferred_schema.get(col_name)
+                reference_type = reference_schema.get(col_name)
+
+                if inferred_type is None:
+                    tee.write(f"❌ MISSING: {col_name}\n")
+                    tee.write(f"   Reference: {reference_type}\n")
+                    tee.write("   Inferred:  NOT FOUND\n")
+                    tee.write("\n")
+                    missing += 1
+                elif reference_type is None:
+                    tee.write(f"⚠️  EXTRA: {col_name}\n")
+                    tee.write("   Reference: NOT IN REFERENCE\n")
+                    tee.write(f"   Inferred:  {inferred_type}\n")
+                    tee.write("\n")
+                    missing += 1
+                else:
+                    is_match, reason = compare_types(inferred_type, reference_type)
+
+                    if is_match:
+                        tee.write(f"✅ MATCH: {col_name}\n")
+                        tee.write(f"   Reference: {reference_type}\n")
+                        tee.write(f"   Inferred:  {inferred_type}\n")
+                        tee.write(f"   Reason:    {reason}\n")
+                        tee.write("\n")
+                        matches += 1
+                    else:
+                        tee.write(f"❌ MISMATCH: {col_name}\n")
+                        tee.write(f"   Reference: {reference_type}\n")
+                        tee.write(f"   Inferred:  {inferred_type}\n")
+                        tee.write(f"   Reason:    {reason}\n")
+                        tee.write("\n")
+                        mismatches += 1
+
+            # Summary
+            tee.write("=" * 100 + "\n")
+            tee.write("SUMMARY\n")
+            tee.write("=" * 100 + "\n")
+            tee.write(f"Total Columns:   {len(all_columns)}\n")
+            tee.write(f"✅ Matches:      {matches} ({matches/len(all_columns)*100:.1f}%)\n")
+            tee.write(f"❌ Mismatches:   {mismatches} ({mismatches/len(all_columns)*100:.1f}%)\n")
+            tee.write(f"⚠️  Missing:      {missing} ({missing/len(all_columns)*100:.1f}%)\n")
+            tee.write("=" * 100)
+        tmp_file.replace(output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+    # The file has no trailing newline; finish the console line
+    print()
 
     return matches, mismatches, missing
 
 
 def main():
     """Main validation function."""
+    # Imported here so parsing and comparison helpers don't pay for the
+    # pipeline (Pydantic models, Gemini client) at import time
+    from csv2pg_ai_schema_infer.config import DEFAULT_COLUMNS_PER_CHUNK, Config
+    from csv2pg_ai_schema_infer.inference import infer_schema_sync
+    from csv2pg_ai_schema_infer.llm.gemini import GeminiProvider
+    from csv2pg_ai_schema_infer.sampler import sample_csv
 
     # Paths
     project_root = Path(__file__).parent.parent
@@ -234,7 +276,7 @@ def main():
         n_rows=config.sampling.rows,
         encoding=config.sampling.encoding,
     )
-    print(f"   Sampled {len(sample.rows)} rows, {len(sample.headers)} columns")
+    print(f"   Sampled {sample.sample_size} rows, {len(sample.headers)} columns")
 
     # Initialize Gemini provider
     print(f"   Initializing Gemini provider (model: {config.llm.model})...")
@@ -250,8 +292,9 @@ def main():
     inferred_schema_obj = infer_schema_sync(
         sample=sample,
         provider=provider,
-        chunk_size=config.chunking.columns_per_chunk,
+        chunk_size=config.chunking.columns_per_chunk or DEFAULT_COLUMNS_PER_CHUNK,
         use_smart_chunking=True,
+        max_concurrency=config.chunking.max_concurrent_requests,
     )
 
     # Convert to dict for comparison
@@ -1,10 +1,24 @@
 """Column chunking module for processing wide CSVs."""
 
+from collections import defaultdict
 
+from .config import DEFAULT_COLUMNS_PER_CHUNK
 from .sampler import sample_csv_columns
 from .types import ColumnChunk, CSVSample
 from .utils.logger import logger
 
+# Below this many columns a fixed chunk size is cheaper than tuning it
+AUTO_CHUNK_MIN_COLUMNS = 50
+
+# Approximate budget for sample data in one prompt (~4 characters per token)
+PROMPT_SAMPLE_CHAR_BUDGET = 60_000
+
+# Rows of sample data included in each prompt
+PROMPT_SAMPLE_ROWS = 20
+
+# Longest sample value included in a prompt (longer values are cut off)
+PROMPT_MAX_VALUE_CHARS = 80
+
 
 def chunk_columns(
     sample: CSVSample,
@@ -29,23 +43,21 @@ def chunk_columns(
     # Calculate number of chunks
     total_chunks = (total_columns + chunk_size - 1) // chunk_size
 
-    chunks = []
-    for i in range(total_chunks):
-        start_idx = i * chunk_size
-        end_idx = min(start_idx + chunk_size, total_columns)
-
-        chunk_columns_list = columns[start_idx:end_idx]
-
-        # Extract sample data for these columns
-        chunk_data = sample_csv_columns(sample, chunk_columns_list)
+    chunks_data = [
+        columns[start_idx : start_idx + chunk_size]
+        for start_idx in range(0, total_columns, chunk_size)
+    ]
 
-        chunk = ColumnChunk(
+    chunks = [
+        ColumnChunk(
             chunk_id=i,
             total_chunks=total_chunks,
             columns=chunk_columns_list,
-            sample_data=chunk_data,
+            # Extract sample data for these columns
+            sample_data=sample_csv_columns(sample, chunk_columns_list),
         )
-        chunks.append(chunk)
+        for i, chunk_columns_list in enumerate(chunks_data)
+    ]
 
     logger.debug(
         f"Split {total_columns} columns into {total_chunks} chunks "
@@ -79,53 +91,53 @@ def chunk_columns_smart(
         raise ValueError("No columns to chunk")
 
     # Group columns by prefix (before first underscore)
-    groups: dict[str, list[str]] = {}
+    groups: defaultdict[str, list[str]] = defaultdict(list)
     for col in columns:
-        prefix = col.split("_")[0] if "_" in col else "other"
-        if prefix not in groups:
-            groups[prefix] = []
-        groups[prefix].append(col)
-
-    # Build chunks, keeping groups together when possible
-    chunks_data: list[list[str]] = []
-    current_chunk: list[str] = []
-
-    for prefix, group_columns in groups.items():
-        # If adding this group exceeds chunk size
-        if len(current_chunk) + len(group_columns) > chunk_size:
-            # If current chunk is not empty, save it
-            if current_chunk:
-                chunks_data.append(current_chunk)
-                current_chunk = []
-
-            # If group itself is larger than chunk size, split it
-            if len(group_columns) > chunk_size:
-                for i in range(0, len(group_columns), chunk_size):
-                    chunk_group = group_columns[i : i + chunk_size]
-                    chunks_data.append(chunk_group)
-            else:
-                current_chunk = group_columns.copy()
+        idx = col.find("_")
+        groups[col[:idx] if idx > 0 else "other"].append(col)
+
+    # Pack groups into chunks with first-fit decreasing, so chunks (and the
+    # LLM requests made for them) come out close to the same size
+    bins: list[list[str]] = []
+    free: list[int] = []
+
+    for group_columns in sorted(groups.values(), key=len, reverse=True):
+        # If group itself is larger than chunk size, full slices get their own chunk
+        split = len(group_columns) - len(group_columns) % chunk_size
+        for i in range(0, split, chunk_size):
+            bins.append(group_columns[i : i + chunk_size])
+            free.append(0)
+
+        rest = group_columns[split:]
+        if not rest:
+            continue
+        for b, space in enumerate(free):
+            if space >= len(rest):
+                bins[b].extend(rest)
+                free[b] -= len(rest)
+                break
         else:
-            current_chunk.extend(group_columns)
-
-    # Add remaining columns
-    if current_chunk:
-        chunks_data.append(current_chunk)
+            bins.append(rest)
+            free.append(chunk_size - len(rest))
+
+    # Keep CSV column order within and across chunks
+    position = {col: i for i, col in enumerate(columns)}
+    chunks_data = sorted(
+        (sorted(b, key=position.__getitem__) for b in bins),
+        key=lambda b: position[b[0]],
+    )
 
     # Convert to ColumnChunk objects
     total_chunks = len(chunks_data)
-    chunks = []
-
-    for i, chunk_columns_list in enumerate(chunks_data):
-        chunk_data = sample_csv_columns(sample, chunk_columns_list)
-
-        chunk = ColumnChunk(
+    chunks = [
+        ColumnChunk(
             chunk_id=i,
             total_chunks=total_chunks,
             columns=chunk_columns_list,
-            sample_data=chunk_data,
+            sample_data=sample_csv_columns(sample, chunk_columns_list),
         )
-        chunks.append(chunk)
+        for i, chunk_columns_list in enumerate(chunks_data)
+    ]
 
     logger.debug(
         f"Smart-chunked {total_columns} columns into {total_chunks} chunks "
@@ -133,3 +145,55 @@ def chunk_columns_smart(
     )
 
     return chunks
+
+
+def auto_chunk_size(
+    sample: CSVSample,
+    parallel_requests: int,
+    configured: int | None = None,
+    min_size: int = 1,
+    max_size: int = 200,
+) -> int:
+    """
+    Pick a chunk size that spreads columns evenly across parallel requests.
+
+    The size is also capped so one chunk's sample data stays within the
+    prompt budget. A configured size is always kept, and narrow CSVs get
+    DEFAULT_COLUMNS_PER_CHUNK.
+
+    Args:
+        sample: CSV sample
+        parallel_requests: Number of LLM requests that can run at once
+        configured: Chunk size set by the user (None to auto-tune)
+        min_size: Smallest chunk size to return (ChunkingConfig's lower bound)
+        max_size: Largest chunk size to return (ChunkingConfig's upper bound)
+
+    Returns:
+        Number of columns per chunk
+    """
+    if configured is not None:
+        return configured
+
+    total_columns = len(sample.headers)
+    if total_columns < AUTO_CHUNK_MIN_COLUMNS:
+        return DEFAULT_COLUMNS_PER_CHUNK
+
+    parallel_requests = max(1, parallel_requests)
+    size = (total_columns + parallel_requests - 1) // parallel_requests
+
+    # Estimate prompt characters per column from the rows sent to the LLM:
+    # the header field plus one tab-separated field per row
+    total_chars = 0
+    for name in sample.headers:
+        values = sample.columns[name][:PROMPT_SAMPLE_ROWS]
+        total_chars += len(name) + 1
+        total_chars += sum(min(len(str(v)), PROMPT_MAX_VALUE_CHARS) + 1 for v in values)
+    chars_per_column = max(1, total_chars // total_columns)
+    size = min(size, PROMPT_SAMPLE_CHAR_BUDGET // chars_per_column)
+
+    size = max(min_size, min(max_size, size))
+    logger.debug(
+        f"Auto-tuned chunk size to {size} for {total_columns} columns "
+        f"({parallel_requests} parallel requests)"
+    )
+    return size
@@ -4,15 +4,12 @@ from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from . import __version__
+from .chunker import auto_chunk_size
 from .config import load_config
-from .generator import generate_all
 from .inference import infer_schema_heuristic, infer_schema_sync
-from .llm.gemini import GeminiProvider
-from .sampler import sample_csv
+from .sampler import estimate_row_count, probe_csv, sample_csv
 from .state_manager import StateManager
 from .types import ImportPhase
 from .utils.logger import logger, setup_logger
@@ -24,6 +21,17 @@ app = typer.Typer(
 )
 console = Console()
 
+# Characters in a CSV file name that become underscores in the table name
+_TABLE_NAME_TRANS = str.maketrans({"-": "_", " ": "_"})
+
+# Progress descriptions for import_csv; only the counts are formatted per run
+_DESC_SAMPLING = "Sampling CSV file..."
+_DESC_SAMPLED = "✓ Sampled {rows} rows, {columns} columns"
+_DESC_INFERRING = "Inferring PostgreSQL types..."
+_DESC_INFERRED = "✓ Inferred types for {columns} columns"
+_DESC_GENERATING = "Generating configuration files..."
+_DESC_GENERATED = "✓ Generated configuration files"
+
 
 def version_callback(value: bool) -> None:
     """Show version and exit."""
@@ -53,8 +61,11 @@ def import_csv(
     sample_rows: int = typer.Option(
         100, "--sample-rows", "-n", help="Number of rows to sample"
     ),
-    chunk_size: int = typer.Option(
-        20, "--chunk-size", "-c", help="Columns per chunk for LLM processing"
+    chunk_size: int | None = typer.Option(
+        None,
+        "--chunk-size",
+        "-c",
+        help="Columns per chunk for LLM processing (default: auto-tuned)",
     ),
     db_url: str | None = typer.Option(
         None, "--db-url", "-d", help="PostgreSQL connection URL"
@@ -85,6 +96,16 @@ def import_csv(
     ),
 ) -> None:
     """Import CSV file into PostgreSQL with AI-powered schema inference."""
+    # Deferred so --help, --version and validate don't pay for these imports
+    import threading
+    from concurrent.futures import Future
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
+    from .generator import generate_all
+    from .utils.validation import compute_file_checksum, file_stat
+
     # Setup logging
     log_level = "DEBUG" if verbose else "INFO"
     setup_logger(level=log_level)
@@ -116,7 +137,7 @@ def import_csv(
 
     # Get table name
     if table_name is None:
-        table_name = csv_path.stem.lower().replace("-", "_").replace(" ", "_")
+        table_name = csv_path.stem.lower().translate(_TABLE_NAME_TRANS)
 
     console.print("\n[bold]CSV2PG AI Schema Infer[/bold]\n")
     console.print(f"CSV File: [cyan]{csv_path}[/cyan]")
@@ -131,32 +152,60 @@ def import_csv(
         state_file = config.output.directory / f"{table_name}_state.json"
         state_manager = StateManager(state_file)
 
-        # Create initial state
-        state = state_manager.create_initial_state(csv_path, table_name)
+        # Hash the whole CSV in the background while it is sampled, unless a
+        # previous run's state shows the file is unchanged. The stat is taken
+        # first so a change during hashing is caught on resume. A daemon
+        # thread keeps a failed run from waiting at exit for a multi-GB hash
+        # nobody needs.
+        csv_stat = file_stat(csv_path)
+        checksum_future: Future[str] = Future()
+
+        def hash_csv() -> None:
+            try:
+                checksum_future.set_result(compute_file_checksum(csv_path))
+            except BaseException as e:
+                checksum_future.set_exception(e)
+
+        known_checksum = state_manager.known_checksum(csv_path, csv_stat)
+        if known_checksum is not None:
+            checksum_future.set_result(known_checksum)
+        else:
+            threading.Thread(target=hash_csv, name="csv-checksum", daemon=True).start()
 
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            refresh_per_second=4,
         ) as progress:
             # Step 1: Sample CSV
-            task = progress.add_task("Sampling CSV file...", total=None)
+            task = progress.add_task(_DESC_SAMPLING, total=None)
             sample = sample_csv(
                 csv_path,
                 n_rows=config.sampling.rows,
                 encoding=config.sampling.encoding,
             )
+
+            # Create initial state
+            state = state_manager.create_initial_state(
+                csv_path,
+                table_name,
+                checksum=checksum_future.result(),
+                csv_stat=csv_stat,
+            )
             state = state_manager.mark_phase_complete(state, ImportPhase.SAMPLED)
             progress.update(
                 task,
-                description=f"✓ Sampled {sample.sample_size} rows, "
-                f"{len(sample.headers)} columns",
+                description=_DESC_SAMPLED.format(
+                    rows=sample.sample_size, columns=len(sample.headers)
+                ),
             )
             progress.stop_task(task)
 
             # Step 2: Infer schema
-            progress.update(task, description="Inferring PostgreSQL types...")
+            progress.update(task, description=_DESC_INFERRING)
 
+            # Heuristic inference works per column and never chunks
             if no_llm or not config.gemini_api_key:
                 if not no_llm:
                     console.print(
@@ -165,27 +214,44 @@ def import_csv(
                     )
                 schema = infer_schema_heuristic(sample)
             else:
+                from .llm.gemini import GeminiProvider
+
+                # Fan chunk requests out concurrently unless disabled in config
+                max_concurrency = (
+                    config.chunking.max_concurrent_requests
+                    if config.chunking.parallel_requests
+                    else 1
+                )
                 provider = GeminiProvider(
                     api_key=config.gemini_api_key,
                     model=config.llm.model,
                     timeout=config.llm.timeout,
                     retry_attempts=config.llm.retry_attempts,
                     retry_delay=config.llm.retry_delay,
+                    fallback_model=config.llm.fallback_model,
+                )
+                # A size from --chunk-size or the config file is kept as is
+                config.chunking.columns_per_chunk = auto_chunk_size(
+                    sample,
+                    max_concurrency,
+                    configured=config.chunking.columns_per_chunk,
                 )
                 schema = infer_schema_sync(
                     sample,
                     provider,
                     chunk_size=config.chunking.columns_per_chunk,
+                    max_concurrency=max_concurrency,
+                    chunk_timeout=config.llm.chunk_timeout,
                 )
 
             state = state_manager.mark_phase_complete(state, ImportPhase.INFERRED)
             progress.update(
                 task,
-                description=f"✓ Inferred types for {len(schema.columns)} columns",
+                description=_DESC_INFERRED.format(columns=len(schema.columns)),
             )
 
             # Step 3: Generate files
-            progress.update(task, description="Generating configuration files...")
+            progress.update(task, description=_DESC_GENERATING)
             result = generate_all(
                 schema,
                 csv_path,
@@ -194,7 +260,7 @@ def import_csv(
                 dry_run=dry_run,
             )
             state = state_manager.mark_phase_complete(state, ImportPhase.GENERATED)
-            progress.update(task, description="✓ Generated configuration files")
+            progress.update(task, description=_DESC_GENERATED)
 
         # Display schema
         console.print("\n[bold]Inferred Schema:[/bold]\n")
@@ -255,29 +321,39 @@ def validate(
     console.print(f"\n[bold]Validating CSV:[/bold] [cyan]{csv_path}[/cyan]\n")
 
     try:
-        sample = sample_csv(csv_path, n_rows=10)
+        # Rows are only parsed when they will be displayed
+        if show_sample or check_encoding:
+            sample = sample_csv(csv_path, n_rows=10)
+            properties, headers = sample.properties, sample.headers
+        else:
+            properties, headers = probe_csv(csv_path)
 
-        console.print(f"✓ File encoding: [cyan]{sample.properties.encoding}[/cyan]")
-        console.print(f"✓ Delimiter: [cyan]'{sample.properties.delimiter}'[/cyan]")
-        console.print(f"✓ Columns: [cyan]{sample.properties.column_count}[/cyan]")
-        if sample.properties.row_count:
-            console.print(f"✓ Total rows: [cyan]{sample.properties.row_count:,}[/cyan]")
+        console.print(f"✓ File encoding: [cyan]{properties.encoding}[/cyan]")
+        console.print(f"✓ Delimiter: [cyan]'{properties.delimiter}'[/cyan]")
+        console.print(f"✓ Columns: [cyan]{properties.column_count}[/cyan]")
+        # Estimated from the first megabyte rather than counted in a full scan
+        row_count = estimate_row_count(csv_path)
+        console.print(f"✓ Rows (estimated): [cyan]~{row_count:,}[/cyan]")
 
         console.print("\n[bold]Headers:[/bold]\n")
-        for i, header in enumerate(sample.headers[:20], 1):
+        for i, header in enumerate(headers[:20], 1):
             console.print(f"  {i}. {header}")
-        if len(sample.headers) > 20:
-            console.print(f"  ... and {len(sample.headers) - 20} more")
+        if len(headers) > 20:
+            console.print(f"  ... and {len(headers) - 20} more")
 
         if show_sample:
+            from rich.table import Table
+
             console.print("\n[bold]Sample Data (first 5 rows):[/bold]\n")
             table = Table(show_header=True, header_style="bold magenta")
-            for header in sample.headers[:10]:  # Show first 10 columns
+            preview_headers = sample.headers[:10]  # Show first 10 columns
+            for header in preview_headers:
                 table.add_column(header, overflow="fold", max_width=20)
 
-            for row in sample.rows[:5]:
-                values = [str(row.get(h, ""))[:50] for h in sample.headers[:10]]
-                table.add_row(*values)
+            # Slice the column lists directly instead of rebuilding row dicts
+            preview_columns = [sample.columns[h][:5] for h in preview_headers]
+            for row in zip(*preview_columns, strict=True):
+                table.add_row(*(str(value)[:50] for value in row))
 
             console.print(table)
             if len(sample.headers) > 10:
@@ -1,105 +1,232 @@
 """Configuration management for CSV2PG AI Schema Infer."""
 
+import dataclasses
+import functools
 import multiprocessing
+import os
+import types
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, Self
 
-import yaml
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
 
+# Columns per LLM request when the chunk size is left to auto-tuning and the
+# CSV is too narrow to tune it for
+DEFAULT_COLUMNS_PER_CHUNK = 20
 
-class SamplingConfig(BaseSettings):
-    """CSV sampling configuration."""
+# CPU count is read once; it is used by every PerformanceConfig default
+_CPU = multiprocessing.cpu_count()
 
-    rows: int = Field(default=100, ge=1, le=10000)
-    encoding: str = Field(default="utf-8")
 
-    model_config = SettingsConfigDict(env_prefix="CSV2PG_SAMPLING_")
+@functools.cache
+def _dotenv() -> dict[str, str | None]:
+    """Read the .env file in the working directory once per process."""
+    return dotenv_values(".env")
 
 
-class ChunkingConfig(BaseSettings):
-    """Column chunking configuration."""
+def _environ() -> dict[str, str]:
+    """Snapshot the process environment with lower-cased names."""
+    return {name.lower(): value for name, value in os.environ.items()}
+
 
-    columns_per_chunk: int = Field(default=20, ge=1, le=200)
-    parallel_requests: bool = Field(default=True)
+def _env_setting(name: str, default: str = "") -> str:
+    """Look up a setting in the environment, then in the .env file."""
+    name = name.lower()
+    value = _environ().get(name)
+    if value is None:
+        value = next(
+            (v for k, v in _dotenv().items() if k.lower() == name and v is not None),
+            None,
+        )
+    return default if value is None else value
 
-    model_config = SettingsConfigDict(env_prefix="CSV2PG_CHUNKING_")
 
+# Strings accepted for boolean settings (the same set pydantic accepts)
+_TRUE_STRINGS = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"0", "false", "f", "no", "n", "off"})
 
-class LLMConfig(BaseSettings):
-    """LLM provider configuration."""
 
-    provider: str = Field(default="gemini")
-    model: str = Field(
-        default="gemini-flash-latest",
-        description=(
-            "Gemini model: gemini-flash-latest (default), gemini-pro-latest, "
-            "gemini-2.5-pro, gemini-2.0-flash, gemini-flash-lite-latest"
+def _coerce(name: str, value: Any, target: Any) -> Any:
+    """
+    Convert an environment or YAML value to a config field type.
+
+    Args:
+        name: Setting name, for error messages
+        value: Raw value (a string from the environment, any YAML scalar)
+        target: Annotated type of the field
+
+    Returns:
+        Value converted to the field type
+
+    Raises:
+        ValueError: If the value cannot be converted
+    """
+    if isinstance(target, types.UnionType) and type(None) in target.__args__:
+        # Optional field: None (YAML null) stays None, anything else converts
+        if value is None:
+            return None
+        (target,) = (arg for arg in target.__args__ if arg is not type(None))
+    if target is bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in _TRUE_STRINGS:
+            return True
+        if text in _FALSE_STRINGS:
+            return False
+        raise ValueError(f"{name} must be a boolean, got {value!r}")
+    if target is int:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        try:
+            return int(str(value).strip())
+        except ValueError:
+            raise ValueError(f"{name} must be an integer, got {value!r}") from None
+    if target is Path and isinstance(value, str):
+        return Path(value)
+    return value
+
+
+def _check_range(name: str, value: int, ge: int, le: int) -> None:
+    """Validate that an integer setting lies within [ge, le]."""
+    if not ge <= value <= le:
+        raise ValueError(f"{name} must be between {ge} and {le}, got {value}")
+
+
+class _EnvConfig:
+    """Mixin that builds a config section from prefixed environment variables."""
+
+    __slots__ = ()
+
+    env_prefix: ClassVar[str] = ""
+
+    @classmethod
+    def from_env(cls, **overrides: Any) -> Self:
+        """
+        Create the section from environment variables.
+
+        Explicit keyword arguments (e.g. YAML values) take precedence over
+        the environment. Both are converted to the annotated field types,
+        and environment names are matched case-insensitively.
+        """
+        environ = _environ()
+        values: dict[str, Any] = {}
+        for f in dataclasses.fields(cls):  # type: ignore[arg-type]
+            if f.name in overrides:
+                value = overrides[f.name]
+            else:
+                value = environ.get(f"{cls.env_prefix}{f.name}".lower(), "")
+                if not value:
+                    continue
+            values[f.name] = _coerce(f.name, value, f.type)
+        # Unknown keys are passed through so the constructor rejects them
+        values.update(
+            (key, value) for key, value in overrides.items() if key not in values
+        )
+        return cls(**values)
+
+
+@dataclass(slots=True)
+class SamplingConfig(_EnvConfig):
+    """CSV sampling configuration."""
+
+    env_prefix: ClassVar[str] = "CSV2PG_SAMPLING_"
+
+    rows: int = 100
+    encoding: str = "utf-8"
+
+    def __post_init__(self) -> None:
+        _check_range("sampling.rows", self.rows, 1, 10000)
+
+
+@dataclass(slots=True)
+class ChunkingConfig(_EnvConfig):
+    """Column chunking configuration."""
+
+    env_prefix: ClassVar[str] = "CSV2PG_CHUNKING_"
+
+    # None auto-tunes the size to the CSV (see chunker.auto_chunk_size)
+    columns_per_chunk: int | None = None
+    parallel_requests: bool = True
+    max_concurrent_requests: int = 8
+
+    def __post_init__(self) -> None:
+        if self.columns_per_chunk is not None:
+            _check_range(
+                "chunking.columns_per_chunk", self.columns_per_chunk, 1, 200
+            )
+        _check_range(
+            "chunking.max_concurrent_requests", self.max_concurrent_requests, 1, 64
         )
-    )
-    timeout: int = Field(default=30, ge=1, le=300)
-    retry_attempts: int = Field(default=3, ge=0, le=10)
-    retry_delay: int = Field(default=5, ge=1, le=60)
 
-    model_config = SettingsConfigDict(env_prefix="CSV2PG_LLM_")
 
+@dataclass(slots=True)
+class LLMConfig(_EnvConfig):
+    """LLM provider configuration."""
 
-class DatabaseConfig(BaseSettings):
+    env_prefix: ClassVar[str] = "CSV2PG_LLM_"
+
+    provider: str = "gemini"
+    # Gemini model: gemini-flash-latest (default), gemini-pro-latest,
+    # gemini-2.5-pro, gemini-2.0-flash, gemini-flash-lite-latest
+    model: str = "gemini-flash-latest"
+    timeout: int = 30
+    retry_attempts: int = 3
+    retry_delay: int = 5
+    # Upper bound on one chunk's inference, including retries
+    chunk_timeout: int = 120
+    # Model that re-infers LOW confidence columns (unset to disable)
+    fallback_model: str | None = None
+
+    def __post_init__(self) -> None:
+        _check_range("llm.timeout", self.timeout, 1, 300)
+        _check_range("llm.retry_attempts", self.retry_attempts, 0, 10)
+        _check_range("llm.retry_delay", self.retry_delay, 1, 60)
+        _check_range("llm.chunk_timeout", self.chunk_timeout, 1, 600)
+
+
+@dataclass(slots=True)
+class DatabaseConfig(_EnvConfig):
     """Database configuration."""
 
-    connection_template: str = Field(
-        default="postgresql://{user}:{password}@{host}:{port}/{dbname}"
-    )
+    env_prefix: ClassVar[str] = "CSV2PG_DATABASE_"
 
-    model_config = SettingsConfigDict(env_prefix="CSV2PG_DATABASE_")
+    connection_template: str = "postgresql://{user}:{password}@{host}:{port}/{dbname}"
 
 
-class OutputConfig(BaseSettings):
+@dataclass(slots=True)
+class OutputConfig(_EnvConfig):
     """Output configuration."""
 
-    directory: Path = Field(default=Path("./output"))
-    dry_run: bool = Field(default=False)
-
-    @field_validator("directory", mode="before")
-    @classmethod
-    def validate_directory(cls, v: Any) -> Path:
-        """Convert string to Path."""
-        if isinstance(v, str):
-            return Path(v)
-        return v
+    env_prefix: ClassVar[str] = "CSV2PG_OUTPUT_"
 
-    model_config = SettingsConfigDict(env_prefix="CSV2PG_OUTPUT_")
+    # Strings from YAML or the environment are converted by from_env
+    directory: Path = Path("./output")
+    dry_run: bool = False
 
 
-class PerformanceConfig(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class PerformanceConfig(_EnvConfig):
     """Performance settings for pgloader."""
 
+    env_prefix: ClassVar[str] = "CSV2PG_PERFORMANCE_"
+
     # CPU settings (auto-detect by default)
-    workers: int = Field(
-        default_factory=lambda: max(4, multiprocessing.cpu_count() // 2),
-        description="Number of parallel worker threads for CSV reading",
-    )
-    concurrency: int = Field(
-        default_factory=lambda: max(2, multiprocessing.cpu_count() // 4),
-        description="Number of parallel PostgreSQL connections",
-    )
+    # Number of parallel worker threads for CSV reading
+    workers: int = field(default_factory=lambda: max(4, _CPU // 2))
+    # Number of parallel PostgreSQL connections
+    concurrency: int = field(default_factory=lambda: max(2, _CPU // 4))
 
     # Memory and batch settings
-    batch_size: str = Field(
-        default="50MB", description="Size of data chunks sent to PostgreSQL"
-    )
-    prefetch_rows: int = Field(
-        default=25000, description="Number of rows to buffer in memory"
-    )
-    work_mem: str = Field(
-        default="512MB", description="Per-operation memory for sorting/hashing"
-    )
-    maintenance_work_mem: str = Field(
-        default="2GB", description="Memory for index creation and maintenance"
-    )
-
-    model_config = SettingsConfigDict(env_prefix="CSV2PG_PERFORMANCE_")
+    # Size of data chunks sent to PostgreSQL
+    batch_size: str = "50MB"
+    # Number of rows to buffer in memory
+    prefetch_rows: int = 25000
+    # Per-operation memory for sorting/hashing
+    work_mem: str = "512MB"
+    # Memory for index creation and maintenance
+    maintenance_work_mem: str = "2GB"
 
     @classmethod
     def auto_detect(cls, file_size_gb: float | None = None) -> "PerformanceConfig":
@@ -112,7 +239,21 @@ class PerformanceConfig(BaseSettings):
         Returns:
             Performance configuration optimized for the environment
         """
-        cpu_cores = multiprocessing.cpu_count()
+        # Only the size tier affects the result, so cache per tier
+        if file_size_gb and file_size_gb > 5:
+            size_tier = "large"
+        elif file_size_gb and file_size_gb > 1:
+            size_tier = "medium"
+        else:
+            size_tier = "small"
+
+        return cls._for_size_tier(size_tier)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def _for_size_tier(cls, size_tier: str) -> "PerformanceConfig":
+        """Build the auto-detected configuration for a file size tier."""
+        cpu_cores = _CPU
 
         # Scale workers based on CPU cores
         if cpu_cores >= 32:
@@ -129,10 +270,10 @@ class PerformanceConfig(BaseSettings):
             concurrency = max(1, workers // 2)
 
         # Scale batch size and prefetch based on file size
-        if file_size_gb and file_size_gb > 5:
+        if size_tier == "large":
             batch_size = "100MB"
             prefetch_rows = 50000
-        elif file_size_gb and file_size_gb > 1:
+        elif size_tier == "medium":
             batch_size = "50MB"
             prefetch_rows = 25000
         else:
@@ -153,23 +294,20 @@ class PerformanceConfig(BaseSettings):
         )
 
 
-class Config(BaseSettings):
+@dataclass(slots=True)
+class Config:
     """Main configuration."""
 
-    sampling: SamplingConfig = Field(default_factory=SamplingConfig)
-    chunking: ChunkingConfig = Field(default_factory=ChunkingConfig)
-    llm: LLMConfig = Field(default_factory=LLMConfig)
-    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
-    output: OutputConfig = Field(default_factory=OutputConfig)
-    performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
+    sampling: SamplingConfig = field(default_factory=SamplingConfig.from_env)
+    chunking: ChunkingConfig = field(default_factory=ChunkingConfig.from_env)
+    llm: LLMConfig = field(default_factory=LLMConfig.from_env)
+    database: DatabaseConfig = field(default_factory=DatabaseConfig.from_env)
+    output: OutputConfig = field(default_factory=OutputConfig.from_env)
+    performance: PerformanceConfig = field(default_factory=PerformanceConfig.from_env)
 
     # API Keys
-    gemini_api_key: str = Field(default="", env="GEMINI_API_KEY")
-    database_url: str = Field(default="", env="DATABASE_URL")
-
-    model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="allow"
-    )
+    gemini_api_key: str = field(default_factory=lambda: _env_setting("GEMINI_API_KEY"))
+    database_url: str = field(default_factory=lambda: _env_setting("DATABASE_URL"))
 
     @classmethod
     def from_yaml(cls, yaml_path: Path) -> "Config":
@@ -177,22 +315,32 @@ class Config(BaseSettings):
         if not yaml_path.exists():
             return cls()
 
-        with open(yaml_path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_yaml(yaml_path, yaml_path.stat().st_mtime_ns)
 
-        # Create nested config objects
+        # Create nested config objects (YAML values override the environment)
         config_data = {
-            "sampling": SamplingConfig(**data.get("sampling", {})),
-            "chunking": ChunkingConfig(**data.get("chunking", {})),
-            "llm": LLMConfig(**data.get("llm", {})),
-            "database": DatabaseConfig(**data.get("database", {})),
-            "output": OutputConfig(**data.get("output", {})),
-            "performance": PerformanceConfig(**data.get("performance", {})),
+            "sampling": SamplingConfig.from_env(**data.get("sampling", {})),
+            "chunking": ChunkingConfig.from_env(**data.get("chunking", {})),
+            "llm": LLMConfig.from_env(**data.get("llm", {})),
+            "database": DatabaseConfig.from_env(**data.get("database", {})),
+            "output": OutputConfig.from_env(**data.get("output", {})),
+            "performance": PerformanceConfig.from_env(**data.get("performance", {})),
         }
 
         return cls(**config_data)
 
 
+@functools.lru_cache(maxsize=4)
+def _read_yaml(yaml_path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML config file, cached by path and modification time."""
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(yaml_path) as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
 def load_config(config_path: Path | None = None) -> Config:
     """
     Load configuration from YAML file and environment variables.
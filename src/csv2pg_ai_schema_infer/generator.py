@@ -1,20 +1,109 @@
 """Configuration and script generation module."""
 
+from __future__ import annotations
+
+import functools
+import os
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-
-from jinja2 import Environment, FileSystemLoader
+from typing import TYPE_CHECKING, Any
 
 from .config import PerformanceConfig
 from .types import GenerationResult, TableSchema
 from .utils.logger import logger
 
+if TYPE_CHECKING:
+    # jinja2 is imported on first render so commands that never render
+    # don't load it
+    from jinja2 import Environment, FileSystemBytecodeCache, Template
+
+# Generated files are written in one flush unless they exceed this size
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def _executable_opener(path: str, flags: int) -> int:
+    """Open a file for writing and make it executable (rwxr-xr-x)."""
+    fd = os.open(path, flags, 0o755)
+    # The create mode is masked by umask and ignored for existing files
+    os.fchmod(fd, 0o755)
+    return fd
+
+
+def _write_rendered(
+    template: Template,
+    context: dict[str, Any],
+    path: Path,
+    opener: Callable[[str, int], int] | None = None,
+) -> None:
+    """
+    Stream a rendered template to a file.
+
+    The output goes to a temporary file next to the destination, which is
+    moved into place once rendering has finished, so a failed render never
+    leaves a truncated file behind.
+
+    Args:
+        template: Template to render
+        context: Template variables
+        path: Destination file
+        opener: Custom opener for the file (see open())
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", buffering=WRITE_BUFFER_SIZE, opener=opener) as f:
+            f.writelines(template.generate(**context))
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 def get_templates_dir() -> Path:
     """Get templates directory path."""
     return Path(__file__).parent / "templates"
 
 
+def _get_bytecode_cache() -> FileSystemBytecodeCache | None:
+    """
+    Get a persistent bytecode cache so CLI runs skip template compilation.
+
+    Returns:
+        Bytecode cache in the user cache directory, or None if unavailable
+    """
+    from jinja2 import FileSystemBytecodeCache
+
+    try:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(cache_home) / "csv2pg-ai-schema-infer" / "jinja2"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Template bytecode cache disabled: {e}")
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+@functools.cache
+def _get_env() -> Environment:
+    """Get the shared Jinja2 environment for the packaged templates."""
+    from jinja2 import Environment, FileSystemLoader
+
+    # Templates ship with the package, so there is no need to re-stat them.
+    # Cached bytecode is keyed on the template source checksum.
+    return Environment(
+        loader=FileSystemLoader(get_templates_dir()),
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=_get_bytecode_cache(),
+    )
+
+
+@functools.cache
+def _get_template(name: str) -> Template:
+    """Load and compile a template once per process."""
+    return _get_env().get_template(name)
+
+
 def generate_pgloader_config(
     schema: TableSchema,
     csv_path: Path,
@@ -37,14 +126,13 @@ def generate_pgloader_config(
     Returns:
         Path to generated config file
     """
-    # Load template
-    templates_dir = get_templates_dir()
-    env = Environment(loader=FileSystemLoader(templates_dir))
-    template = env.get_template("pgloader.jinja2")
-
     # Auto-detect performance config if not provided
     if performance_config is None:
-        file_size_gb = csv_path.stat().st_size / (1024**3) if csv_path.exists() else None
+        # One stat call; a missing file just means no size hint
+        try:
+            file_size_gb = csv_path.stat().st_size / (1024**3)
+        except OSError:
+            file_size_gb = None
         performance_config = PerformanceConfig.auto_detect(file_size_gb)
         logger.info(
             f"Auto-detected performance config: workers={performance_config.workers}, "
@@ -74,18 +162,17 @@ def generate_pgloader_config(
         "maintenance_work_mem": performance_config.maintenance_work_mem,
     }
 
-    # Render template
-    config_content = template.render(**context)
-
     # Write to file
     output_dir.mkdir(parents=True, exist_ok=True)
     config_path = output_dir / f"{schema.table_name}.load"
 
+    template = _get_template("pgloader.jinja2")
     if not dry_run:
-        with open(config_path, "w") as f:
-            f.write(config_content)
+        _write_rendered(template, context, config_path)
         logger.info(f"Generated pgloader config: {config_path}")
     else:
+        # Render anyway so template errors still show up on a dry run
+        template.render(**context)
         logger.info(f"[DRY RUN] Would generate: {config_path}")
 
     return config_path
@@ -115,36 +202,28 @@ def generate_import_script(
     Returns:
         Path to generated script
     """
-    # Load template
-    templates_dir = get_templates_dir()
-    env = Environment(loader=FileSystemLoader(templates_dir))
-    template = env.get_template("import.sh.jinja2")
-
     # Prepare template variables
+    # Paths in the script must be absolute; look up the cwd once for all of them
+    cwd = Path.cwd()
     context = {
         "generation_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "csv_path": str(csv_path.absolute()),
+        "csv_path": str(cwd / csv_path),
         "table_name": table_name,
-        "config_file": str(config_path.absolute()),
-        "state_file": str(state_file.absolute()),
-        "log_file": str(log_file.absolute()),
+        "config_file": str(cwd / config_path),
+        "state_file": str(cwd / state_file),
+        "log_file": str(cwd / log_file),
     }
 
-    # Render template
-    script_content = template.render(**context)
-
     # Write to file
     script_path = output_dir / f"{table_name}_import.sh"
 
+    template = _get_template("import.sh.jinja2")
     if not dry_run:
-        with open(script_path, "w") as f:
-            f.write(script_content)
-
-        # Make executable
-        script_path.chmod(0o755)
-
+        _write_rendered(template, context, script_path, opener=_executable_opener)
         logger.info(f"Generated import script: {script_path}")
     else:
+        # Render anyway so template errors still show up on a dry run
+        template.render(**context)
         logger.info(f"[DRY RUN] Would generate: {script_path}")
 
     return script_path
@@ -174,10 +253,10 @@ def generate_all(
     """
     logger.info("Generating configuration and scripts...")
 
-    # Create output directory
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Both generators embed the CSV location; resolve it once
+    csv_path = csv_path.absolute()
 
-    # Generate pgloader config
+    # Generate pgloader config (this also creates the output directory)
     config_path = generate_pgloader_config(
         schema, csv_path, output_dir, database_url, performance_config, dry_run
     )
@@ -1,11 +1,17 @@
 """Type inference orchestration module."""
 
-import asyncio
+import functools
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
 
 from .chunker import chunk_columns, chunk_columns_smart
 from .llm.base import LLMProvider
 from .types import (
+    ColumnChunk,
     ColumnSample,
     ColumnSchema,
     ConfidenceLevel,
@@ -15,6 +21,47 @@ from .types import (
 )
 from .utils.logger import logger
 
+# Concurrent LLM requests allowed by default (matches chunking config)
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Heuristic inference fans out to worker processes above this many columns.
+# Typing one column of HEURISTIC_SAMPLE_VALUES values takes about 50µs, while
+# starting a pool of fresh interpreters that import this package takes about
+# 0.25s, so the pool only pays off once a sample has thousands of columns.
+PARALLEL_HEURISTIC_MIN_COLUMNS = 5000
+
+# Columns handed to each heuristic worker process
+PARALLEL_HEURISTIC_COLUMNS_PER_WORKER = 50
+
+# Non-null values per column examined by heuristic type inference
+HEURISTIC_SAMPLE_VALUES = 100
+
+# Patterns used by heuristic type inference
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")  # YYYY-MM-DD
+_TS_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}")  # ISO 8601
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_BOOLEAN_VALUES = frozenset({"true", "false", "t", "f", "yes", "no", "y", "n", "1", "0"})
+
+# Name fragments that mark a numeric column as currency/financial
+_CURRENCY_KEYWORDS = ("usd", "price", "value", "amount", "total", "funding", "valuation")
+
+# Column name sanitization: ASCII names go through a translate table,
+# anything else falls back to the regex
+_NON_IDENTIFIER_RE = re.compile(r"[^a-z0-9_]")
+_SANITIZE_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if not (c.isalnum() or c == "_")}
+)
+
+# Integer types accepted for *_id primary key candidates
+_INTEGER_TYPES = frozenset({"integer", "bigint"})
+
+# Non-digit characters that can start a value accepted by int() / float()
+_INT_START = frozenset("+-")
+_FLOAT_START = frozenset("+-.nNiI")  # signs, ".5", nan, inf
+
 # PostgreSQL reserved keywords that need prefixing
 POSTGRES_RESERVED_KEYWORDS = {
     "all", "analyse", "analyze", "and", "any", "array", "as", "asc", "asymmetric",
@@ -31,6 +78,7 @@ POSTGRES_RESERVED_KEYWORDS = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_column_name(name: str) -> str:
     """
     Sanitize column name for PostgreSQL compatibility.
@@ -51,10 +99,14 @@ def sanitize_column_name(name: str) -> str:
 
     # Replace dots and special characters with underscores
     # Keep only alphanumeric and underscore
-    name = re.sub(r'[^a-z0-9_]', '_', name)
+    if name.isascii():
+        name = name.translate(_SANITIZE_TABLE)
+    else:
+        name = _NON_IDENTIFIER_RE.sub('_', name)
 
     # Remove consecutive underscores
-    name = re.sub(r'_+', '_', name)
+    while '__' in name:
+        name = name.replace('__', '_')
 
     # Remove leading/trailing underscores
     name = name.strip('_')
@@ -74,6 +126,20 @@ def sanitize_column_name(name: str) -> str:
     return name
 
 
+@functools.lru_cache(maxsize=128)
+def _table_name_from_path(path: Path) -> str:
+    """
+    Derive a PostgreSQL table name from a CSV file name.
+
+    Args:
+        path: Path to the CSV file
+
+    Returns:
+        Sanitized table name based on the file stem
+    """
+    return sanitize_column_name(path.stem)
+
+
 def heuristic_type_inference(column: ColumnSample) -> InferredType:
     """
     Fallback heuristic type inference based on pattern matching.
@@ -87,10 +153,23 @@ def heuristic_type_inference(column: ColumnSample) -> InferredType:
     # Sanitize column name
     sanitized_name = sanitize_column_name(column.name)
 
-    # Get non-null values
-    non_null_values = [v for v in column.values if v is not None and str(v).strip()]
-
-    if not non_null_values:
+    # Strip, drop blanks and dedupe the sampled non-null values in one pass.
+    # Every check below is per value, so repeats (common in low-cardinality
+    # columns) only need to be classified once.
+    unique_values: dict[str, Any] = {}
+    sampled = 0
+    for raw in column.values:
+        if raw is None:
+            continue
+        v = str(raw).strip()
+        if not v:
+            continue
+        unique_values.setdefault(v, raw)
+        sampled += 1
+        if sampled == HEURISTIC_SAMPLE_VALUES:
+            break
+
+    if not unique_values:
         return InferredType(
             column_name=sanitized_name,
             pg_type="text",
@@ -99,15 +178,77 @@ def heuristic_type_inference(column: ColumnSample) -> InferredType:
             nullable=True,
         )
 
-    # Sample first 100 values for analysis
-    sample_values = non_null_values[:100]
-    str_values = [str(v).strip() for v in sample_values]
+    # Classify every value in a single pass. Each flag records whether all
+    # values seen so far match that type; checks stop once a flag is cleared.
+    is_uuid = is_bool = is_int = is_float = is_date = is_ts = is_email = True
+    min_val = max_val = 0
+    has_decimals = False
+
+    for i, (v, raw) in enumerate(unique_values.items()):
+        # Cheap length/character checks rule most values out before a regex
+        # or a failing int()/float() call is needed
+        size = len(v)
+        first = v[0]
+        starts_with_digit = first.isdigit()
+
+        if is_uuid and (size != 36 or _UUID_RE.match(v) is None):
+            is_uuid = False
+        if is_bool and v.lower() not in _BOOLEAN_VALUES:
+            is_bool = False
+
+        # Polars already parsed numeric columns; only strings need parsing.
+        # A value that parsed as an integer is also a whole float, so the
+        # float check below only runs for values that aren't integers.
+        raw_type = type(raw)
+        whole = raw_type is int
+        if is_int:
+            if whole:
+                n = raw
+            elif raw_type is float:
+                is_int = False
+            else:
+                # int() only accepts a sign, decimal digits and "_" separators,
+                # so anything else is ruled out without a failing parse
+                digits = v[1:] if first in _INT_START else v
+                if digits.isdecimal() or "_" in digits:
+                    try:
+                        n = int(v)
+                        whole = True
+                    except ValueError:
+                        is_int = False
+                else:
+                    is_int = False
+            if is_int:
+                if i == 0:
+                    min_val = max_val = n
+                elif n < min_val:
+                    min_val = n
+                elif n > max_val:
+                    max_val = n
+        if is_float and not whole:
+            if raw_type is float:
+                f = raw
+            elif not starts_with_digit and first not in _FLOAT_START:
+                is_float = False
+            else:
+                try:
+                    f = float(v)
+                except ValueError:
+                    is_float = False
+            # Skip NaN and infinity
+            if is_float and not has_decimals and f - f == 0 and f != int(f):
+                has_decimals = True
+        if is_date and (size != 10 or v[4] != "-" or _DATE_RE.match(v) is None):
+            is_date = False
+        if is_ts and (size < 19 or v[10] not in "T " or _TS_RE.match(v) is None):
+            is_ts = False
+        if is_email and ("@" not in v or _EMAIL_RE.match(v) is None):
+            is_email = False
+        if not (is_uuid or is_bool or is_int or is_float or is_date or is_ts or is_email):
+            break
 
     # UUID pattern
-    uuid_pattern = re.compile(
-        r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
-    )
-    if all(uuid_pattern.match(v) for v in str_values):
+    if is_uuid:
         return InferredType(
             column_name=sanitized_name,
             pg_type="uuid",
@@ -117,8 +258,7 @@ def heuristic_type_inference(column: ColumnSample) -> InferredType:
         )
 
     # Boolean pattern
-    boolean_values = {"true", "false", "t", "f", "yes", "no", "y", "n", "1", "0"}
-    if all(v.lower() in boolean_values for v in str_values):
+    if is_bool:
         return InferredType(
             column_name=sanitized_name,
             pg_type="boolean",
@@ -127,16 +267,8 @@ def heuristic_type_inference(column: ColumnSample) -> InferredType:
             nullable=column.null_percentage > 0,
         )
 
-    # Check for currency/financial columns by name
-    is_currency_column = any(keyword in sanitized_name for keyword in
-                             ['usd', 'price', 'value', 'amount', 'total', 'funding', 'valuation'])
-
     # Integer pattern
-    try:
-        int_values = [int(v) for v in str_values]
-        max_val = max(int_values)
-        min_val = min(int_values)
-
+    if is_int:
         # Check if fits in integer or needs bigint
         if -2147483648 <= min_val <= 2147483647 and -2147483648 <= max_val <= 2147483647:
             pg_type = "integer"
@@ -150,16 +282,13 @@ def heuristic_type_inference(column: ColumnSample) -> InferredType:
             reasoning=f"All values are integers (range: {min_val} to {max_val})",
             nullable=column.null_percentage > 0,
         )
-    except (ValueError, TypeError):
-        pass
 
     # Decimal/numeric pattern
-    try:
-        float_values = [float(v) for v in str_values]
-        # Check if any value has decimal places
-        has_decimals = any(v != int(v) for v in float_values if not (v != v))  # Skip NaN
-
+    if is_float:
         # Force numeric for currency columns or if decimals detected
+        is_currency_column = any(
+            keyword in sanitized_name for keyword in _CURRENCY_KEYWORDS
+        )
         if is_currency_column or has_decimals:
             return InferredType(
                 column_name=sanitized_name,
@@ -176,12 +305,9 @@ def heuristic_type_inference(column: ColumnSample) -> InferredType:
             reasoning="All values are numeric",
             nullable=column.null_percentage > 0,
         )
-    except (ValueError, TypeError):
-        pass
 
     # Date pattern (YYYY-MM-DD)
-    date_pattern = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-    if all(date_pattern.match(v) for v in str_values):
+    if is_date:
         return InferredType(
             column_name=sanitized_name,
             pg_type="date",
@@ -191,10 +317,7 @@ def heuristic_type_inference(column: ColumnSample) -> InferredType:
         )
 
     # Timestamp pattern (ISO 8601)
-    timestamp_pattern = re.compile(
-        r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}"
-    )
-    if all(timestamp_pattern.match(v) for v in str_values):
+    if is_ts:
         return InferredType(
             column_name=sanitized_name,
             pg_type="timestamptz",
@@ -204,8 +327,7 @@ def heuristic_type_inference(column: ColumnSample) -> InferredType:
         )
 
     # Email pattern
-    email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-    if all(email_pattern.match(v) for v in str_values):
+    if is_email:
         return InferredType(
             column_name=sanitized_name,
             pg_type="text",
@@ -215,7 +337,7 @@ def heuristic_type_inference(column: ColumnSample) -> InferredType:
         )
 
     # Default to text
-    max_length = max(len(v) for v in str_values)
+    max_length = max(map(len, unique_values))
     if max_length < 255:
         pg_type = f"varchar({max_length + 50})"  # Add buffer
         reasoning = f"String values with max length {max_length}"
@@ -248,8 +370,15 @@ def build_column_samples(sample: CSVSample) -> list[ColumnSample]:
         # Sanitize column name for PostgreSQL
         sanitized_name = sanitize_column_name(col_name)
 
-        values = [row.get(col_name) for row in sample.rows]
-        null_count = sum(1 for v in values if v is None or str(v).strip() == "")
+        values = sample.columns[col_name]
+        null_count = sample.null_counts.get(col_name)
+        if null_count is None:
+            # Only strings can be blank; don't stringify numbers and dates
+            null_count = sum(
+                1
+                for v in values
+                if v is None or v == "" or (isinstance(v, str) and not v.strip())
+            )
 
         column_samples.append(
             ColumnSample(
@@ -263,12 +392,59 @@ def build_column_samples(sample: CSVSample) -> list[ColumnSample]:
     return column_samples
 
 
+def _detect_primary_key(columns: list[ColumnSchema]) -> str | None:
+    """
+    Pick the most likely primary key column.
+
+    Priority: identifier_uuid > uuid > *uuid* > id > integer *_id columns.
+    Ties go to the earliest column.
+
+    Args:
+        columns: Inferred column schemas
+
+    Returns:
+        Primary key column name, or None if there is no candidate
+    """
+    best_rank = 5  # One past the lowest-priority rank
+    primary_key = None
+
+    for col in columns:
+        col_lower = col.name.lower()
+        if col.pg_type == "uuid":
+            if "uuid" not in col_lower:
+                continue
+            if "identifier" in col_lower:
+                rank = 0
+            elif col_lower == "uuid":
+                rank = 1
+            else:
+                rank = 2
+        elif col_lower == "id":
+            rank = 3
+        elif col_lower.endswith("_id") and col.pg_type in _INTEGER_TYPES:
+            rank = 4
+        else:
+            continue
+
+        if rank < best_rank:
+            best_rank = rank
+            primary_key = col.name
+            if rank == 0:
+                break  # Nothing outranks identifier_uuid
+
+    if primary_key is not None:
+        logger.info(f"Selected primary key: {primary_key}")
+    return primary_key
+
+
 async def infer_schema_async(
     sample: CSVSample,
     provider: LLMProvider,
     chunk_size: int = 20,
     use_smart_chunking: bool = True,
     use_fallback: bool = True,
+    max_concurrency: int | None = DEFAULT_MAX_CONCURRENCY,
+    chunk_timeout: float | None = None,
 ) -> TableSchema:
     """
     Infer table schema asynchronously using LLM provider.
@@ -279,54 +455,90 @@ async def infer_schema_async(
         chunk_size: Columns per chunk
         use_smart_chunking: Use smart chunking to group related columns
         use_fallback: Use heuristic fallback if LLM fails
+        max_concurrency: Maximum number of concurrent LLM requests (None for no limit)
+        chunk_timeout: Seconds to wait for one chunk before it falls back to
+            heuristics (None to wait indefinitely). The timeout only stops
+            waiting: a provider that runs requests on threads keeps the
+            abandoned call running, so it should give each call its own
+            daemon thread that neither blocks later chunks nor process exit.
 
     Returns:
         Complete table schema
     """
+    # Imported here so the heuristic-only path doesn't pay for asyncio
+    import asyncio
+
     logger.info(f"Starting type inference for {len(sample.headers)} columns")
 
-    # Chunk columns
-    if use_smart_chunking:
+    # Chunk columns. When everything fits in one chunk, grouping by prefix
+    # can't change the result.
+    if use_smart_chunking and len(sample.headers) > chunk_size:
         chunks = chunk_columns_smart(sample, chunk_size)
     else:
         chunks = chunk_columns(sample, chunk_size)
 
     logger.info(f"Processing {len(chunks)} column chunks")
 
-    # Process chunks in parallel
-    tasks = [provider.infer_types(chunk) for chunk in chunks]
-
-    try:
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-    except Exception as e:
-        logger.error(f"Failed to infer types with LLM: {e}")
-        if use_fallback:
-            logger.info("Falling back to heuristic inference")
-            return infer_schema_heuristic(sample)
-        raise
-
-    # Merge results
-    all_inferred_types: list[InferredType] = []
-    failed_chunks = []
-
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            logger.warning(f"Chunk {i} failed: {result}")
-            failed_chunks.append(chunks[i])
-        else:
-            all_inferred_types.extend(result)
+    # Process chunks in parallel, bounded by max_concurrency
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def infer_chunk(chunk: ColumnChunk) -> list[InferredType]:
+        # A timed-out chunk surfaces as TimeoutError and takes the fallback path
+        if semaphore is None:
+            return await asyncio.wait_for(provider.infer_types(chunk), chunk_timeout)
+        async with semaphore:
+            return await asyncio.wait_for(provider.infer_types(chunk), chunk_timeout)
+
+    # Each chunk's types land in its own slot so the schema keeps chunk order
+    inferred_by_chunk: list[list[InferredType]] = [[] for _ in chunks]
+    fallback_tasks: list[tuple[int, asyncio.Task[list[InferredType]]]] = []
+    sample_map: dict[str, ColumnSample] | None = None
+
+    def start_fallback(i: int) -> None:
+        nonlocal sample_map
+        if sample_map is None:
+            # Chunks list the original headers; column samples carry sanitized names
+            sample_map = dict(
+                zip(sample.headers, build_column_samples(sample), strict=True)
+            )
+        fallback_samples = [
+            sample_map[col_name]
+            for col_name in chunks[i].columns
+            if col_name in sample_map
+        ]
+        # Type the chunk on a worker thread while other LLM requests are in
+        # flight. A chunk is at most a couple of hundred columns, which the
+        # heuristics get through in milliseconds, so no process pool here.
+        task = asyncio.create_task(
+            asyncio.to_thread(list, map(heuristic_type_inference, fallback_samples))
+        )
+        fallback_tasks.append((i, task))
+
+    async def infer_or_fall_back(i: int, chunk: ColumnChunk) -> None:
+        try:
+            inferred_by_chunk[i] = await infer_chunk(chunk)
+        except Exception as e:
+            logger.warning(f"Chunk {i} failed: {e!r}")
+            if use_fallback:
+                start_fallback(i)
+
+    if len(chunks) == 1:
+        # A single chunk is awaited directly rather than scheduled as a task
+        await infer_or_fall_back(0, chunks[0])
+    else:
+        await asyncio.gather(
+            *(infer_or_fall_back(i, chunk) for i, chunk in enumerate(chunks))
+        )
 
-    # Handle failed chunks with heuristic fallback
-    if failed_chunks and use_fallback:
-        logger.info(f"Using heuristic fallback for {len(failed_chunks)} failed chunks")
-        column_samples = build_column_samples(sample)
-        sample_map = {cs.name: cs for cs in column_samples}
+    # Collect heuristic fallback results for failed chunks
+    if fallback_tasks:
+        logger.info(f"Used heuristic fallback for {len(fallback_tasks)} failed chunks")
+        for i, task in fallback_tasks:
+            inferred_by_chunk[i] = await task
 
-        for chunk in failed_chunks:
-            for col_name in chunk.columns:
-                if col_name in sample_map:
-                    inferred = heuristic_type_inference(sample_map[col_name])
-                    all_inferred_types.append(inferred)
+    all_inferred_types = [
+        inferred for chunk_types in inferred_by_chunk for inferred in chunk_types
+    ]
 
     # Convert to schema
     columns = []
@@ -341,36 +553,13 @@ async def infer_schema_async(
         columns.append(col_schema)
 
     # Detect primary key candidate (DO NOT add to constraints yet - will be in AFTER LOAD)
-    # Priority: identifier_uuid > uuid > id > *_id columns
-    primary_key = None
-    pk_candidates = []
-
-    for col in columns:
-        col_lower = col.name.lower()
-        if col.pg_type == "uuid":
-            # Prioritize identifier_uuid and similar
-            if "identifier" in col_lower and "uuid" in col_lower:
-                pk_candidates.append((0, col.name))  # Highest priority
-            elif col_lower == "uuid":
-                pk_candidates.append((1, col.name))
-            elif "uuid" in col_lower:
-                pk_candidates.append((2, col.name))
-        elif col_lower == "id":
-            pk_candidates.append((3, col.name))
-        elif col_lower.endswith("_id") and col.pg_type in ("integer", "bigint"):
-            pk_candidates.append((4, col.name))
-
-    # Select the highest priority candidate
-    if pk_candidates:
-        pk_candidates.sort(key=lambda x: x[0])
-        primary_key = pk_candidates[0][1]
-        logger.info(f"Selected primary key: {primary_key}")
+    primary_key = _detect_primary_key(columns)
 
     # DO NOT add PRIMARY KEY to column constraints
     # It will be added in AFTER LOAD section for better performance
 
     # Generate table name from file name
-    table_name = sanitize_column_name(sample.path.stem)
+    table_name = _table_name_from_path(sample.path)
 
     schema = TableSchema(
         table_name=table_name,
@@ -392,6 +581,8 @@ def infer_schema_sync(
     chunk_size: int = 20,
     use_smart_chunking: bool = True,
     use_fallback: bool = True,
+    max_concurrency: int | None = DEFAULT_MAX_CONCURRENCY,
+    chunk_timeout: float | None = None,
 ) -> TableSchema:
     """
     Synchronous version of infer_schema_async.
@@ -402,15 +593,64 @@ def infer_schema_sync(
         chunk_size: Columns per chunk
         use_smart_chunking: Use smart chunking
         use_fallback: Use heuristic fallback if LLM fails
+        max_concurrency: Maximum number of concurrent LLM requests (None for no limit)
+        chunk_timeout: Seconds to wait for one chunk before falling back
 
     Returns:
         Complete table schema
     """
+    import asyncio
+
     return asyncio.run(
-        infer_schema_async(sample, provider, chunk_size, use_smart_chunking, use_fallback)
+        infer_schema_async(
+            sample,
+            provider,
+            chunk_size,
+            use_smart_chunking,
+            use_fallback,
+            max_concurrency,
+            chunk_timeout,
+        )
     )
 
 
+def _heuristic_infer_columns(column_samples: list[ColumnSample]) -> list[InferredType]:
+    """
+    Run heuristic inference over columns, in worker processes for wide CSVs.
+
+    Columns are independent, so wide samples are split across processes.
+
+    Args:
+        column_samples: Column samples to infer
+
+    Returns:
+        Inferred types in the same order as the column samples
+    """
+    cpu_count = os.cpu_count() or 1
+    if len(column_samples) <= PARALLEL_HEURISTIC_MIN_COLUMNS or cpu_count <= 2:
+        return [heuristic_type_inference(col_sample) for col_sample in column_samples]
+
+    per_worker = PARALLEL_HEURISTIC_COLUMNS_PER_WORKER
+    workers = min(cpu_count, -(-len(column_samples) // per_worker))
+    logger.debug(
+        f"Running heuristic inference for {len(column_samples)} columns "
+        f"on {workers} processes"
+    )
+    # Workers start from a fresh interpreter: forking would copy a process
+    # that already runs gRPC, logging and checksum threads
+    start_method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context(start_method)
+    ) as pool:
+        return list(
+            pool.map(heuristic_type_inference, column_samples, chunksize=per_worker)
+        )
+
+
 def infer_schema_heuristic(sample: CSVSample) -> TableSchema:
     """
     Infer schema using only heuristics (no LLM).
@@ -426,8 +666,7 @@ def infer_schema_heuristic(sample: CSVSample) -> TableSchema:
     column_samples = build_column_samples(sample)
     columns = []
 
-    for col_sample in column_samples:
-        inferred = heuristic_type_inference(col_sample)
+    for inferred in _heuristic_infer_columns(column_samples):
         col_schema = ColumnSchema(
             name=inferred.column_name,
             pg_type=inferred.pg_type,
@@ -438,30 +677,10 @@ def infer_schema_heuristic(sample: CSVSample) -> TableSchema:
         columns.append(col_schema)
 
     # Detect primary key candidate (DO NOT add to constraints - will be in AFTER LOAD)
-    primary_key = None
-    pk_candidates = []
-
-    for col in columns:
-        col_lower = col.name.lower()
-        if col.pg_type == "uuid":
-            if "identifier" in col_lower and "uuid" in col_lower:
-                pk_candidates.append((0, col.name))
-            elif col_lower == "uuid":
-                pk_candidates.append((1, col.name))
-            elif "uuid" in col_lower:
-                pk_candidates.append((2, col.name))
-        elif col_lower == "id":
-            pk_candidates.append((3, col.name))
-        elif col_lower.endswith("_id") and col.pg_type in ("integer", "bigint"):
-            pk_candidates.append((4, col.name))
-
-    if pk_candidates:
-        pk_candidates.sort(key=lambda x: x[0])
-        primary_key = pk_candidates[0][1]
-        logger.info(f"Selected primary key: {primary_key}")
+    primary_key = _detect_primary_key(columns)
 
     # Generate table name
-    table_name = sanitize_column_name(sample.path.stem)
+    table_name = _table_name_from_path(sample.path)
 
     return TableSchema(
         table_name=table_name,
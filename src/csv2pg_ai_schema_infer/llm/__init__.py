@@ -1,6 +1,16 @@
 """LLM provider implementations for type inference."""
 
+from typing import Any
+
 from .base import LLMProvider
-from .gemini import GeminiProvider
 
 __all__ = ["LLMProvider", "GeminiProvider"]
+
+
+def __getattr__(name: str) -> Any:
+    # The Gemini SDK is slow to import, so load it only when requested
+    if name == "GeminiProvider":
+        from .gemini import GeminiProvider
+
+        return GeminiProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
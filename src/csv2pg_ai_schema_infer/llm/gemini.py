@@ -1,16 +1,97 @@
 """Google Gemini LLM provider implementation."""
 
 import asyncio
+import json
+import random
+import threading
 import time
+from concurrent.futures import Future
+from itertools import islice, zip_longest
+from types import ModuleType
+from typing import Any
 
 import google.generativeai as genai
 from google.generativeai.types import GenerationConfig
 from pydantic import BaseModel, Field
 
+from ..chunker import PROMPT_MAX_VALUE_CHARS, PROMPT_SAMPLE_ROWS
 from ..types import ColumnChunk, InferredType, ConfidenceLevel
 from ..utils.logger import logger
 from .base import LLMProvider
 
+# Longest wait between retries, before jitter
+MAX_RETRY_DELAY = 60
+
+# Confidence strings returned by the model, by upper-cased value
+_CONFIDENCE_LEVELS = {level.name: level for level in ConfidenceLevel}
+
+# Keep each sample row on one line of the TSV table
+_TSV_ESCAPES = str.maketrans({"\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# Static parts of the type inference prompt; only the column list and sample
+# table change between chunks
+_PROMPT_HEADER = (
+    "You are a PostgreSQL database schema expert. Analyze these CSV columns "
+    "and suggest optimal PostgreSQL data types."
+)
+
+_SAMPLE_NOTE = (
+    "tab-separated with a header line; empty fields are NULL and values over "
+    f'{PROMPT_MAX_VALUE_CHARS} characters are cut off with "…"'
+)
+
+_PROMPT_GUIDELINES = """For each column, determine:
+1. The most appropriate PostgreSQL type (use exact type names)
+2. Whether the column should be nullable (true/false)
+3. Confidence level in your assessment (HIGH, MEDIUM, or LOW)
+4. Brief reasoning for your type choice
+5. Any constraints if applicable
+6. Cast rule if needed (usually null)
+
+PostgreSQL type guidelines:
+- Use "integer" for small whole numbers (-2B to 2B), "bigint" for large ones
+- Use "numeric" for decimals requiring exact precision (money, financial data)
+- Use "real" or "double precision" for floating point
+- Use "text" for unbounded strings, "varchar(n)" only if you know the limit
+- Use "timestamptz" for timestamps with timezone
+- Use "date" for dates without time
+- Use "uuid" for UUID patterns
+- Use "boolean" for true/false values
+- Use "jsonb" for JSON data
+- Set nullable=true if any NULL values exist in the sample
+
+Analyze each column carefully and provide accurate type recommendations."""
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is used instead
+    orjson = None
+
+
+def _loads(text: str) -> Any:
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _format_value(value: Any) -> str:
+    """Format one sample value as a TSV field."""
+    if value is None:
+        return ""
+    text = str(value).translate(_TSV_ESCAPES)
+    if len(text) > PROMPT_MAX_VALUE_CHARS:
+        return text[:PROMPT_MAX_VALUE_CHARS] + "…"
+    return text
+
+
+def _format_sample(columns: list[str], rows: list[tuple[Any, ...]]) -> str:
+    """Format sample rows as a tab-separated table with a header line."""
+    lines = ["\t".join(columns)]
+    lines.extend("\t".join(map(_format_value, row)) for row in rows)
+    return "\n".join(lines)
+
 
 # Simplified schema for API (without defaults that Gemini doesn't support)
 class InferredTypeAPI(BaseModel):
@@ -34,6 +115,7 @@ class GeminiProvider(LLMProvider):
         timeout: int = 30,
         retry_attempts: int = 3,
         retry_delay: int = 5,
+        fallback_model: str | None = None,
     ):
         """
         Initialize Gemini provider.
@@ -44,6 +126,8 @@ class GeminiProvider(LLMProvider):
             timeout: Request timeout in seconds
             retry_attempts: Number of retry attempts
             retry_delay: Delay between retries in seconds
+            fallback_model: Model that re-infers LOW confidence columns
+                (None to keep the primary model's answer)
         """
         if not api_key:
             raise ValueError("Gemini API key is required")
@@ -54,49 +138,50 @@ class GeminiProvider(LLMProvider):
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
 
+        # Structured output with the simplified Pydantic schema. The SDK
+        # converts the schema when a model is built, so models created with
+        # this config don't repeat that work on every request.
+        self._generation_config = GenerationConfig(
+            response_mime_type="application/json",
+            response_schema=list[InferredTypeAPI],
+        )
+
         # Configure Gemini
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        self.model = genai.GenerativeModel(
+            model, generation_config=self._generation_config
+        )
+        self.fallback_model_name = fallback_model
+        self.fallback_model = (
+            genai.GenerativeModel(
+                fallback_model, generation_config=self._generation_config
+            )
+            if fallback_model
+            else None
+        )
 
         logger.debug(f"Initialized Gemini provider with model: {model}")
 
     def _build_prompt(self, chunk: ColumnChunk) -> str:
         """Build prompt for type inference using structured output."""
-        import json
-
-        # Format sample data (limit to 20 rows for token efficiency)
-        sample_str = json.dumps(chunk.sample_data[:20], indent=2)
-
-        prompt = f"""You are a PostgreSQL database schema expert. Analyze these CSV columns and suggest optimal PostgreSQL data types.
-
-Columns to analyze: {', '.join(chunk.columns)}
-
-Sample data (first 20 rows):
-{sample_str}
-
-For each column, determine:
-1. The most appropriate PostgreSQL type (use exact type names)
-2. Whether the column should be nullable (true/false)
-3. Confidence level in your assessment (HIGH, MEDIUM, or LOW)
-4. Brief reasoning for your type choice
-5. Any constraints if applicable
-6. Cast rule if needed (usually null)
-
-PostgreSQL type guidelines:
-- Use "integer" for small whole numbers (-2B to 2B), "bigint" for large ones
-- Use "numeric" for decimals requiring exact precision (money, financial data)
-- Use "real" or "double precision" for floating point
-- Use "text" for unbounded strings, "varchar(n)" only if you know the limit
-- Use "timestamptz" for timestamps with timezone
-- Use "date" for dates without time
-- Use "uuid" for UUID patterns
-- Use "boolean" for true/false values
-- Use "jsonb" for JSON data
-- Set nullable=true if any NULL values exist in the sample
-
-Analyze each column carefully and provide accurate type recommendations."""
-
-        return prompt
+        # Format sample data (limited rows for token efficiency). A TSV table
+        # doesn't repeat column names and quotes on every row like JSON.
+        # Columns missing from the sample are left empty.
+        rows = list(
+            islice(
+                zip_longest(*(chunk.sample_data.get(col, ()) for col in chunk.columns)),
+                PROMPT_SAMPLE_ROWS,
+            )
+        )
+        sample_str = _format_sample(chunk.columns, rows)
+
+        return (
+            f"{_PROMPT_HEADER}\n\n"
+            f"Columns to analyze: {', '.join(chunk.columns)}\n\n"
+            f"Sample data (first {len(rows)} rows, {_SAMPLE_NOTE}):\n"
+            f"{sample_str}\n\n"
+            f"{_PROMPT_GUIDELINES}"
+        )
 
     def _validate_response(self, inferred_types: list[InferredType], chunk: ColumnChunk) -> list[InferredType]:
         """Validate and sanitize the structured response."""
@@ -108,7 +193,7 @@ Analyze each column carefully and provide accurate type recommendations."""
 
         # Log any low confidence types
         for inferred in inferred_types:
-            if inferred.confidence.value == "LOW":
+            if inferred.confidence is ConfidenceLevel.LOW:
                 logger.warning(
                     f"Low confidence type for column {inferred.column_name}: "
                     f"{inferred.pg_type} - {inferred.reasoning}"
@@ -126,15 +211,121 @@ Analyze each column carefully and provide accurate type recommendations."""
         Returns:
             List of inferred types
         """
-        # Run sync version in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.infer_types_sync, chunk)
+        # Run sync version on its own daemon thread. A chunk timeout can't stop
+        # a call that is already running; it keeps its thread until the request
+        # itself gives up. A thread per call means later chunks never queue
+        # behind such abandoned calls, and a daemon thread doesn't hold up
+        # process exit (a pool's worker threads are joined at exit).
+        future: Future[list[InferredType]] = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self.infer_types_sync(chunk))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name="gemini", daemon=True).start()
+        return await asyncio.wrap_future(future)
 
     def infer_types_sync(self, chunk: ColumnChunk) -> list[InferredType]:
         """
         Infer types synchronously with retry logic using structured output.
 
+        LOW confidence columns are re-inferred with the fallback model when
+        one is configured.
+
+        Args:
+            chunk: Column chunk
+
+        Returns:
+            List of inferred types
+
+        Raises:
+            Exception: If all retries fail
+        """
+        inferred_types = self._request_types(self.model, chunk)
+        if self.fallback_model is not None:
+            inferred_types = self._recheck_low_confidence(inferred_types, chunk)
+        return inferred_types
+
+    def _recheck_low_confidence(
+        self, inferred_types: list[InferredType], chunk: ColumnChunk
+    ) -> list[InferredType]:
+        """
+        Re-infer LOW confidence columns with the fallback model.
+
         Args:
+            inferred_types: Types returned by the primary model
+            chunk: Column chunk the types were inferred for
+
+        Returns:
+            Inferred types, with rechecked columns replaced in place
+        """
+        fallback = self.fallback_model
+        if fallback is None:
+            return inferred_types
+
+        low = {
+            t.column_name
+            for t in inferred_types
+            if t.confidence is ConfidenceLevel.LOW
+        }
+        columns = [col for col in chunk.columns if col in low]
+        if not columns:
+            return inferred_types
+
+        logger.info(
+            f"Re-checking {len(columns)} low confidence columns with "
+            f"{self.fallback_model_name}"
+        )
+        sub_chunk = ColumnChunk(
+            chunk_id=chunk.chunk_id,
+            total_chunks=chunk.total_chunks,
+            columns=columns,
+            sample_data={
+                col: chunk.sample_data[col]
+                for col in columns
+                if col in chunk.sample_data
+            },
+        )
+        try:
+            rechecked = {
+                t.column_name: t
+                for t in self._request_types(fallback, sub_chunk)
+            }
+        except Exception as e:
+            logger.warning(f"Fallback model failed, keeping primary types: {e}")
+            return inferred_types
+
+        return [rechecked.get(t.column_name, t) for t in inferred_types]
+
+    def _backoff(self, attempt: int) -> float:
+        """
+        Seconds to wait before retrying after a failed attempt.
+
+        Exponential in the attempt number, capped at MAX_RETRY_DELAY, plus up
+        to a second of jitter so concurrent chunks don't retry in lockstep.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+
+        Returns:
+            Delay in seconds
+        """
+        # int ** int is typed Any (a negative exponent gives a float)
+        delay: float = min(MAX_RETRY_DELAY, self.retry_delay * 2**attempt)
+        return delay + random.uniform(0, 1)
+
+    def _request_types(
+        self, model: genai.GenerativeModel, chunk: ColumnChunk
+    ) -> list[InferredType]:
+        """
+        Request types for a chunk from one model, retrying on failure.
+
+        Args:
+            model: Gemini model to call
             chunk: Column chunk
 
         Returns:
@@ -153,41 +344,37 @@ Analyze each column carefully and provide accurate type recommendations."""
                     f"{chunk.total_chunks} (attempt {attempt + 1})"
                 )
 
-                # Use structured output with simplified Pydantic schema
-                generation_config = GenerationConfig(
-                    response_mime_type="application/json",
-                    response_schema=list[InferredTypeAPI],
-                )
-
-                response = self.model.generate_content(
+                # The structured output config was set on the model
+                response = model.generate_content(
                     prompt,
-                    generation_config=generation_config,
+                    request_options={"timeout": self.timeout},
                 )
 
                 if not response or not response.text:
                     raise ValueError("Empty response from Gemini API")
 
                 # Parse the structured JSON response
-                import json
-                response_data = json.loads(response.text)
+                response_data = _loads(response.text)
 
-                # Convert to InferredType objects (with proper enum conversion)
+                # Convert to InferredType objects (with proper enum conversion).
+                # The model's output is untrusted, so each item is validated;
+                # a malformed item fails the attempt and is retried.
                 inferred_types = []
                 for item in response_data:
-                    # Convert confidence string to enum
-                    confidence_str = item.get("confidence", "MEDIUM").upper()
-                    if confidence_str not in ["HIGH", "MEDIUM", "LOW"]:
-                        confidence_str = "MEDIUM"
-
-                    inferred_types.append(InferredType(
-                        column_name=item["column_name"],
-                        pg_type=item["pg_type"],
-                        confidence=ConfidenceLevel[confidence_str],
-                        reasoning=item["reasoning"],
-                        nullable=item["nullable"],
-                        constraints=item.get("constraints", []),
-                        cast_rule=item.get("cast_rule"),
-                    ))
+                    # Convert confidence string to enum (unknown values -> MEDIUM)
+                    confidence = _CONFIDENCE_LEVELS.get(
+                        str(item.get("confidence", "")).upper(), ConfidenceLevel.MEDIUM
+                    )
+
+                    inferred_types.append(InferredType.model_validate({
+                        "column_name": item["column_name"],
+                        "pg_type": item["pg_type"],
+                        "confidence": confidence,
+                        "reasoning": item["reasoning"],
+                        "nullable": item["nullable"],
+                        "constraints": item.get("constraints", []),
+                        "cast_rule": item.get("cast_rule"),
+                    }))
 
                 if not inferred_types:
                     raise ValueError("Parsed response is empty")
@@ -210,9 +397,8 @@ Analyze each column carefully and provide accurate type recommendations."""
                 )
 
                 if attempt < self.retry_attempts - 1:
-                    # Exponential backoff
-                    delay = self.retry_delay * (2**attempt)
-                    logger.debug(f"Retrying in {delay} seconds...")
+                    delay = self._backoff(attempt)
+                    logger.debug(f"Retrying in {delay:.1f} seconds...")
                     time.sleep(delay)
 
         # All retries failed
@@ -1,14 +1,22 @@
 """CSV sampling and analysis module."""
 
+import codecs
+import csv
+import io
 from pathlib import Path
 from typing import Any
 
-import charset_normalizer
-import polars as pl
-
+# polars and charset-normalizer are imported where they are used, so
+# commands that never read the CSV (--help, state-only runs) skip loading them
 from .types import CSVProperties, CSVSample
 from .utils.logger import logger
 
+# Bytes read from the start of a file to detect its delimiter
+DETECT_SAMPLE_BYTES = 1024 * 1024
+
+# Bytes read from the start of a file to estimate its row count
+ROW_COUNT_SAMPLE_BYTES = 1024 * 1024
+
 
 def detect_encoding(file_path: Path) -> str:
     """
@@ -24,6 +32,20 @@ def detect_encoding(file_path: Path) -> str:
         # Read first 100KB for detection
         raw_data = f.read(102400)
 
+    # Most CSVs are UTF-8 (or plain ASCII, a subset of it). Checking that is
+    # a fast C-level decode; charset-normalizer's scoring is only needed for
+    # everything else. The incremental decoder tolerates a character cut off
+    # at the end of the buffer.
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(raw_data, final=False)
+    except UnicodeDecodeError:
+        pass
+    else:
+        logger.debug("Detected encoding: utf-8")
+        return "utf-8"
+
+    import charset_normalizer
+
     result = charset_normalizer.from_bytes(raw_data).best()
     if result is None:
         logger.warning("Could not detect encoding, defaulting to utf-8")
@@ -47,9 +69,19 @@ def detect_csv_properties(
     Returns:
         CSV properties
     """
+    import polars as pl
+
     if encoding is None:
         encoding = detect_encoding(file_path)
 
+    # Detection only looks at a few rows; parse them from the start of the
+    # file, since read_csv loads the whole file even when n_rows is set
+    with open(file_path, "rb") as f:
+        head = f.read(DETECT_SAMPLE_BYTES)
+    last_newline = head.rfind(b"\n")
+    if last_newline >= 0:
+        head = head[: last_newline + 1]
+
     # Try different delimiters
     delimiters = [",", "\t", "|", ";"]
 
@@ -57,7 +89,7 @@ def detect_csv_properties(
         try:
             # Try to read first few rows with this delimiter
             df = pl.read_csv(
-                file_path,
+                io.BytesIO(head),
                 separator=delimiter,
                 encoding=encoding,
                 n_rows=5,
@@ -71,21 +103,14 @@ def detect_csv_properties(
                     f"({df.shape[1]} columns detected)"
                 )
 
-                # Get total row count (approximate for large files)
-                try:
-                    full_df = pl.scan_csv(
-                        file_path, separator=delimiter, encoding=encoding
-                    )
-                    row_count = full_df.select(pl.count()).collect().item()
-                except Exception:
-                    row_count = None
-
+                # Row count is left unset: counting means reading the whole
+                # file (see estimate_row_count)
                 return CSVProperties(
                     delimiter=delimiter,
                     encoding=encoding,
                     quote_char='"',
                     has_header=True,
-                    row_count=row_count,
+                    row_count=None,
                     column_count=df.shape[1],
                 )
         except Exception as e:
@@ -104,6 +129,96 @@ def detect_csv_properties(
     )
 
 
+def estimate_row_count(
+    file_path: Path, sample_bytes: int = ROW_COUNT_SAMPLE_BYTES
+) -> int:
+    """
+    Estimate the number of data rows from the start of the file.
+
+    Files no larger than the sample are counted exactly (one row per line).
+    Larger files are extrapolated from the average line length in the sample.
+
+    Args:
+        file_path: Path to CSV file
+        sample_bytes: Bytes to read from the start of the file
+
+    Returns:
+        Estimated number of rows, excluding the header
+    """
+    file_size = file_path.stat().st_size
+    with open(file_path, "rb") as f:
+        head = f.read(sample_bytes)
+    if not head:
+        return 0
+
+    if len(head) >= file_size:
+        lines = head.count(b"\n")
+        if not head.endswith(b"\n"):
+            lines += 1  # Last line has no terminator
+        return max(0, lines - 1)
+
+    # Average over whole data lines only; the header is usually shorter
+    header_end = head.find(b"\n") + 1
+    body = head[header_end : head.rfind(b"\n") + 1]
+    if not body:
+        return 1  # Not even one whole data line fits in the sample
+    return round(body.count(b"\n") * (file_size - header_end) / len(body))
+
+
+def _resolve_properties(
+    path: Path, encoding: str | None, delimiter: str | None
+) -> CSVProperties:
+    """Detect CSV properties and apply explicit overrides."""
+    properties = detect_csv_properties(path, encoding)
+
+    if delimiter:
+        properties.delimiter = delimiter
+    if encoding:
+        properties.encoding = encoding
+
+    return properties
+
+
+def probe_csv(
+    path: Path,
+    encoding: str | None = None,
+    delimiter: str | None = None,
+) -> tuple[CSVProperties, list[str]]:
+    """
+    Detect CSV properties and read the header row without sampling data.
+
+    Args:
+        path: Path to CSV file
+        encoding: Optional encoding override
+        delimiter: Optional delimiter override
+
+    Returns:
+        Tuple of (CSV properties, headers)
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file is empty
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"CSV file not found: {path}")
+
+    logger.info(f"Probing CSV file: {path}")
+
+    properties = _resolve_properties(path, encoding, delimiter)
+
+    with open(path, newline="", encoding=properties.encoding) as f:
+        reader = csv.reader(
+            f, delimiter=properties.delimiter, quotechar=properties.quote_char
+        )
+        headers = next(reader, [])
+        has_rows = next(reader, None) is not None
+
+    if not headers or not has_rows:
+        raise ValueError("CSV file is empty")
+
+    return properties, headers
+
+
 def sample_csv(
     path: Path,
     n_rows: int = 100,
@@ -126,18 +241,14 @@ def sample_csv(
         FileNotFoundError: If file doesn't exist
         ValueError: If file is empty or malformed
     """
+    import polars as pl
+
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {path}")
 
     logger.info(f"Sampling CSV file: {path}")
 
-    # Detect properties if not provided
-    properties = detect_csv_properties(path, encoding)
-
-    if delimiter:
-        properties.delimiter = delimiter
-    if encoding:
-        properties.encoding = encoding
+    properties = _resolve_properties(path, encoding, delimiter)
 
     # Read sample with polars using lazy scan for large files
     try:
@@ -160,23 +271,43 @@ def sample_csv(
     # Extract headers
     headers = df.columns
 
-    # Convert to list of dicts for easier processing
-    rows = df.to_dicts()
+    # Keep the data column-wise; inference works one column at a time
+    columns = df.to_dict(as_series=False)
+    sample_size = df.height
+
+    # Count null and blank values for every column in one vectorised pass
+    null_counts = dict(
+        zip(
+            headers,
+            df.select(
+                (
+                    pl.col(name).is_null() | (pl.col(name).str.strip_chars() == "")
+                    if dtype == pl.Utf8
+                    else pl.col(name).is_null()
+                ).sum()
+                for name, dtype in df.schema.items()
+            ).row(0),
+            strict=True,
+        )
+    )
 
     logger.info(
-        f"Sampled {len(rows)} rows, {len(headers)} columns from {path.name}"
+        f"Sampled {sample_size} rows, {len(headers)} columns from {path.name}"
     )
 
     return CSVSample(
         path=path,
         properties=properties,
         headers=headers,
-        rows=rows,
-        sample_size=len(rows),
+        columns=columns,
+        sample_size=sample_size,
+        null_counts=null_counts,
     )
 
 
-def sample_csv_columns(sample: CSVSample, column_names: list[str]) -> list[dict[str, Any]]:
+def sample_csv_columns(
+    sample: CSVSample, column_names: list[str]
+) -> dict[str, list[Any]]:
     """
     Extract specific columns from CSV sample.
 
@@ -185,11 +316,8 @@ def sample_csv_columns(sample: CSVSample, column_names: list[str]) -> list[dict[
         column_names: List of column names to extract
 
     Returns:
-        List of dicts with only specified columns
+        Sample values keyed by column, for the specified columns only
     """
-    filtered_rows = []
-    for row in sample.rows:
-        filtered_row = {col: row.get(col) for col in column_names if col in row}
-        filtered_rows.append(filtered_row)
-
-    return filtered_rows
+    # The sample is already column-wise, so this shares the value lists
+    # instead of building a dict per row
+    return {col: sample.columns[col] for col in column_names if col in sample.columns}
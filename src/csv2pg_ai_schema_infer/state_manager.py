@@ -1,13 +1,26 @@
 """State management for import operations."""
 
-import json
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from .types import ImportPhase, ImportState, ImportStatus
 from .utils.logger import logger
-from .utils.validation import compute_file_checksum
+from .utils.validation import compute_file_checksum, file_stat
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry change (such as a rename) to disk, where supported."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows can't open a directory to fsync it
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
 
 
 class StateManager:
@@ -26,7 +39,7 @@ class StateManager:
         """
         Atomically save state to JSON file.
 
-        Uses temp file + rename for atomic writes.
+        Uses temp file + fsync + rename for atomic, durable writes.
 
         Args:
             state: Import state to save
@@ -34,22 +47,8 @@ class StateManager:
         # Ensure parent directory exists
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Serialize state to JSON
-        state_dict = state.model_dump(mode="json")
-
-        # Convert datetime objects to ISO format strings
-        if "timestamps" in state_dict:
-            timestamps = {}
-            for key, value in state_dict["timestamps"].items():
-                if isinstance(value, datetime):
-                    timestamps[key] = value.isoformat()
-                else:
-                    timestamps[key] = value
-            state_dict["timestamps"] = timestamps
-
-        # Convert Path to string
-        if "csv_path" in state_dict:
-            state_dict["csv_path"] = str(state_dict["csv_path"])
+        # pydantic serializes datetimes and paths itself, in native code
+        data = state.model_dump_json(indent=2).encode()
 
         # Write to temp file first
         temp_fd, temp_path = tempfile.mkstemp(
@@ -57,11 +56,15 @@ class StateManager:
         )
 
         try:
-            with open(temp_fd, "w") as f:
-                json.dump(state_dict, f, indent=2)
+            with open(temp_fd, "wb") as f:
+                f.write(data)
+                # Make the contents durable before the rename publishes them
+                f.flush()
+                os.fsync(f.fileno())
 
-            # Atomic rename
-            Path(temp_path).rename(self.state_file)
+            # Atomic rename (replaces an existing state file on every platform)
+            os.replace(temp_path, self.state_file)
+            _fsync_dir(self.state_file.parent)
 
             logger.debug(f"Saved state to {self.state_file}")
 
@@ -88,37 +91,42 @@ class StateManager:
             raise FileNotFoundError(f"State file not found: {self.state_file}")
 
         try:
-            with open(self.state_file) as f:
-                state_dict = json.load(f)
-
-            # Convert string timestamps back to datetime
-            if "timestamps" in state_dict:
-                timestamps = {}
-                for key, value in state_dict["timestamps"].items():
-                    if value is not None:
-                        try:
-                            timestamps[key] = datetime.fromisoformat(value)
-                        except (ValueError, TypeError):
-                            timestamps[key] = None
-                    else:
-                        timestamps[key] = None
-                state_dict["timestamps"] = timestamps
-
-            # Convert csv_path string to Path
-            if "csv_path" in state_dict:
-                state_dict["csv_path"] = Path(state_dict["csv_path"])
-
-            state = ImportState(**state_dict)
-
-            logger.debug(f"Loaded state from {self.state_file}")
-
-            return state
-
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in state file: {e}") from e
+            state = ImportState.model_validate_json(self.state_file.read_bytes())
+        except ValidationError as e:
+            if any(err["type"] == "json_invalid" for err in e.errors()):
+                raise ValueError(f"Invalid JSON in state file: {e}") from e
+            raise ValueError(f"Failed to load state: {e}") from e
         except Exception as e:
             raise ValueError(f"Failed to load state: {e}") from e
 
+        logger.debug(f"Loaded state from {self.state_file}")
+
+        return state
+
+    def known_checksum(
+        self, csv_path: Path, csv_stat: tuple[int, int]
+    ) -> str | None:
+        """
+        Reuse the checksum from an existing state file for an unchanged CSV.
+
+        Args:
+            csv_path: Path to CSV file
+            csv_stat: Current (size, mtime_ns) of the CSV file
+
+        Returns:
+            Stored checksum if the state was recorded for this path with the
+            same size and mtime, otherwise None
+        """
+        if not self.state_file.exists():
+            return None
+        try:
+            state = self.load_state()
+        except ValueError:
+            return None
+        if state.csv_path != csv_path or state.csv_stat != csv_stat:
+            return None
+        return state.csv_checksum
+
     def can_resume(self, state: ImportState, csv_path: Path) -> tuple[bool, str]:
         """
         Check if import can be resumed.
@@ -138,14 +146,15 @@ class StateManager:
         if state.csv_path != csv_path:
             return False, f"CSV path mismatch: {state.csv_path} != {csv_path}"
 
-        # Check CSV checksum
+        # Check CSV checksum, unless size and mtime show the file is untouched
         try:
-            current_checksum = compute_file_checksum(csv_path)
-            if current_checksum != state.csv_checksum:
-                return (
-                    False,
-                    "CSV file has changed (checksum mismatch)",
-                )
+            if state.csv_stat is None or file_stat(csv_path) != state.csv_stat:
+                current_checksum = compute_file_checksum(csv_path)
+                if current_checksum != state.csv_checksum:
+                    return (
+                        False,
+                        "CSV file has changed (checksum mismatch)",
+                    )
         except Exception as e:
             return False, f"Failed to verify CSV: {e}"
 
@@ -163,6 +172,8 @@ class StateManager:
         self,
         csv_path: Path,
         table_name: str,
+        checksum: str | None = None,
+        csv_stat: tuple[int, int] | None = None,
     ) -> ImportState:
         """
         Create initial import state.
@@ -170,15 +181,24 @@ class StateManager:
         Args:
             csv_path: Path to CSV file
             table_name: Table name
+            checksum: Precomputed CSV checksum (computed if not provided)
+            csv_stat: CSV (size, mtime_ns) taken before a precomputed checksum
+                was started (taken here if not provided)
 
         Returns:
             Initial import state
         """
-        checksum = compute_file_checksum(csv_path)
+        # The stat must predate the hash: if the file changes while it is
+        # hashed, a later stat would match the new file but not the checksum
+        if csv_stat is None:
+            csv_stat = file_stat(csv_path)
+        if checksum is None:
+            checksum = compute_file_checksum(csv_path)
 
         state = ImportState(
             csv_path=csv_path,
             csv_checksum=checksum,
+            csv_stat=csv_stat,
             table_name=table_name,
             status=ImportStatus.PENDING,
             phase=ImportPhase.SAMPLING,
@@ -1,5 +1,6 @@
 """Type definitions for CSV2PG AI Schema Infer."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -50,13 +51,14 @@ class CSVProperties(BaseModel):
     column_count: int = Field(description="Number of columns")
 
 
-class ColumnSample(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ColumnSample:
     """Sample data for a column."""
 
-    name: str = Field(description="Column name")
-    values: list[Any] = Field(description="Sample values")
-    null_count: int = Field(default=0, description="Number of null values")
-    total_count: int = Field(description="Total number of samples")
+    name: str
+    values: list[Any]
+    null_count: int = 0
+    total_count: int
 
     @property
     def null_percentage(self) -> float:
@@ -66,14 +68,26 @@ class ColumnSample(BaseModel):
         return (self.null_count / self.total_count) * 100
 
 
-class CSVSample(BaseModel):
-    """Sampled CSV data."""
+@dataclass(slots=True, kw_only=True)
+class CSVSample:
+    """Sampled CSV data, stored column-wise."""
+
+    path: Path
+    properties: CSVProperties
+    headers: list[str]
+    columns: dict[str, list[Any]]
+    sample_size: int
+    # Null or blank values per column, counted when the sample is read
+    null_counts: dict[str, int] = field(default_factory=dict)
 
-    path: Path = Field(description="CSV file path")
-    properties: CSVProperties = Field(description="CSV properties")
-    headers: list[str] = Field(description="Column headers")
-    rows: list[dict[str, Any]] = Field(description="Sample rows as dicts")
-    sample_size: int = Field(description="Number of rows sampled")
+    @property
+    def rows(self) -> list[dict[str, Any]]:
+        """Sample rows as dicts, built on demand from the column data."""
+        headers = self.headers
+        return [
+            dict(zip(headers, values, strict=True))
+            for values in zip(*(self.columns[h] for h in headers), strict=True)
+        ]
 
 
 class InferredType(BaseModel):
@@ -120,13 +134,14 @@ class TableSchema(BaseModel):
         return None
 
 
-class ColumnChunk(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ColumnChunk:
     """A chunk of columns for processing."""
 
-    chunk_id: int = Field(description="Chunk identifier")
-    total_chunks: int = Field(description="Total number of chunks")
-    columns: list[str] = Field(description="Column names in this chunk")
-    sample_data: list[dict[str, Any]] = Field(description="Sample data for columns")
+    chunk_id: int
+    total_chunks: int
+    columns: list[str]
+    sample_data: dict[str, list[Any]]  # Sample values for the chunk's columns only
 
 
 class ImportState(BaseModel):
@@ -135,6 +150,9 @@ class ImportState(BaseModel):
     version: str = Field(default="1.0")
     csv_path: Path
     csv_checksum: str = Field(description="SHA256 checksum of CSV file")
+    csv_stat: tuple[int, int] | None = Field(
+        default=None, description="CSV (size, mtime_ns) when the checksum was taken"
+    )
     table_name: str
     status: ImportStatus
     phase: ImportPhase
@@ -1,11 +1,37 @@
 """Logging configuration for CSV2PG AI Schema Infer."""
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
 from rich.logging import RichHandler
 
+# Log files rotate at this size, keeping LOG_FILE_BACKUPS old files
+LOG_FILE_MAX_BYTES = 10_000_000
+LOG_FILE_BACKUPS = 3
+
+# Background listeners writing each logger's file output, keyed by logger name
+_listeners: dict[str, QueueListener] = {}
+
+
+def _stop_listener(name: str) -> None:
+    """Flush and stop the file listener for a logger, if one is running."""
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+@atexit.register
+def _stop_all_listeners() -> None:
+    """Drain queued file records before the interpreter exits."""
+    for name in list(_listeners):
+        _stop_listener(name)
+
 
 def setup_logger(
     name: str = "csv2pg",
@@ -28,6 +54,7 @@ def setup_logger(
 
     # Remove existing handlers
     logger.handlers.clear()
+    _stop_listener(name)
 
     # Rich console handler
     console_handler = RichHandler(
@@ -41,16 +68,29 @@ def setup_logger(
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
 
-    # File handler (if specified)
+    # File handler (if specified). Records are queued and written by a
+    # background thread, so logging calls never block on disk I/O.
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS
+        )
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        logger.addHandler(queue_handler)
+
+        listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        _listeners[name] = listener
 
     return logger
 
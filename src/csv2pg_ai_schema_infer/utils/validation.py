@@ -1,12 +1,112 @@
 """Validation utilities for CSV2PG AI Schema Infer."""
 
+import functools
 import hashlib
 import json
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
 from ..types import InferredType, TableSchema
 
+if TYPE_CHECKING:
+    # Protocol shared by all hashlib objects, blake2b included (stubs only)
+    from _hashlib import _HashObject
+
+# Keys every LLM type response must contain (a tuple keeps the error order)
+_REQUIRED_FIELDS = ("column_name", "postgresql_type", "confidence", "reasoning")
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+# InferredType fields and the response keys accepted for each, in priority order
+_FIELD_ALIASES = (
+    ("column_name", ("column_name", "name")),
+    ("pg_type", ("postgresql_type", "pg_type")),
+    ("confidence", ("confidence",)),
+    ("reasoning", ("reasoning",)),
+    ("nullable", ("nullable",)),
+    ("constraints", ("constraints",)),
+    ("cast_rule", ("cast_rule",)),
+)
+
+# Direct constructors for common checksum algorithms; others go through
+# hashlib.new
+_HASH_CONSTRUCTORS: dict[str, Callable[..., "_HashObject"]] = {
+    "sha256": hashlib.sha256,
+    "sha1": hashlib.sha1,
+    "md5": hashlib.md5,
+    "blake2b": hashlib.blake2b,
+}
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is used instead
+    orjson = None
+
+# Common PostgreSQL base types accepted by validate_postgresql_type
+_VALID_PG_TYPES = frozenset(
+    {
+        # Numeric
+        "smallint",
+        "integer",
+        "int",
+        "bigint",
+        "decimal",
+        "numeric",
+        "real",
+        "double precision",
+        "smallserial",
+        "serial",
+        "bigserial",
+        # Monetary
+        "money",
+        # Character
+        "varchar",
+        "char",
+        "text",
+        # Binary
+        "bytea",
+        # Date/Time
+        "timestamp",
+        "timestamptz",
+        "timestamp with time zone",
+        "timestamp without time zone",
+        "date",
+        "time",
+        "timetz",
+        "interval",
+        # Boolean
+        "boolean",
+        "bool",
+        # Enumerated
+        "enum",
+        # Geometric
+        "point",
+        "line",
+        "lseg",
+        "box",
+        "path",
+        "polygon",
+        "circle",
+        # Network
+        "cidr",
+        "inet",
+        "macaddr",
+        # UUID
+        "uuid",
+        # JSON
+        "json",
+        "jsonb",
+        # Arrays (basic check)
+        "array",
+        # XML
+        "xml",
+    }
+)
+
 
 def validate_inferred_type(data: dict[str, Any]) -> InferredType:
     """
@@ -21,23 +121,23 @@ def validate_inferred_type(data: dict[str, Any]) -> InferredType:
     Raises:
         ValueError: If data is invalid
     """
-    required_fields = ["column_name", "postgresql_type", "confidence", "reasoning"]
-    missing = [f for f in required_fields if f not in data]
-    if missing:
+    # One subset check on the happy path; the list is only built on error
+    if not data.keys() >= _REQUIRED_FIELD_SET:
+        missing = [f for f in _REQUIRED_FIELDS if f not in data]
         raise ValueError(f"Missing required fields: {', '.join(missing)}")
 
-    # Normalize field names (handle both snake_case and variations)
-    normalized = {
-        "column_name": data.get("column_name") or data.get("name"),
-        "pg_type": data.get("postgresql_type") or data.get("pg_type"),
-        "confidence": data.get("confidence", "medium"),
-        "reasoning": data.get("reasoning", ""),
-        "nullable": data.get("nullable", True),
-        "constraints": data.get("constraints", []),
-        "cast_rule": data.get("cast_rule"),
-    }
+    # Normalize field names (handle both snake_case and variations). The
+    # first key present wins, even if its value is empty; fields that are
+    # absent fall back to the model defaults.
+    normalized = {}
+    for field_name, keys in _FIELD_ALIASES:
+        for key in keys:
+            if key in data:
+                normalized[field_name] = data[key]
+                break
 
-    return InferredType(**normalized)
+    # Responses are untrusted, so this validates rather than model_construct
+    return InferredType.model_validate(normalized)
 
 
 def validate_table_schema(schema: TableSchema) -> bool:
@@ -56,11 +156,16 @@ def validate_table_schema(schema: TableSchema) -> bool:
     if not schema.columns:
         raise ValueError("Schema must have at least one column")
 
-    # Check for duplicate column names
-    column_names = [col.name for col in schema.columns]
-    duplicates = [name for name in column_names if column_names.count(name) > 1]
+    # Collect column names and duplicates in a single pass
+    column_names: set[str] = set()
+    duplicates: set[str] = set()
+    for col in schema.columns:
+        if col.name in column_names:
+            duplicates.add(col.name)
+        else:
+            column_names.add(col.name)
     if duplicates:
-        raise ValueError(f"Duplicate column names: {', '.join(set(duplicates))}")
+        raise ValueError(f"Duplicate column names: {', '.join(sorted(duplicates))}")
 
     # Validate primary key exists
     if schema.primary_key:
@@ -83,14 +188,51 @@ def compute_file_checksum(file_path: Path, algorithm: str = "sha256") -> str:
     Returns:
         Hex digest of file checksum
     """
-    hash_func = hashlib.new(algorithm)
+    constructor = _HASH_CONSTRUCTORS.get(algorithm)
+    if constructor is None:
+        constructor = functools.partial(hashlib.new, algorithm)
+
     with open(file_path, "rb") as f:
-        # Read in chunks to handle large files
-        for chunk in iter(lambda: f.read(8192), b""):
-            hash_func.update(chunk)
+        # file_digest reads into one reused 256 KiB buffer instead of
+        # allocating a bytes object per block. The loop itself is Python; only
+        # the reads and the update() calls on those large buffers release the
+        # GIL. The checksum only detects file changes, so the hash is not marked
+        # as security-relevant (md5/sha1 stay usable on FIPS builds).
+        hash_func = hashlib.file_digest(
+            f, functools.partial(constructor, usedforsecurity=False)
+        )
     return f"{algorithm}:{hash_func.hexdigest()}"
 
 
+def file_stat(file_path: Path) -> tuple[int, int]:
+    """Get (size, mtime_ns) for a file, used to skip re-hashing unchanged files."""
+    st = os.stat(file_path)
+    return st.st_size, st.st_mtime_ns
+
+
+def compute_file_checksums(
+    file_paths: Iterable[Path], algorithm: str = "sha256", max_workers: int = 8
+) -> dict[Path, str]:
+    """
+    Compute checksums of several files concurrently.
+
+    Args:
+        file_paths: Paths to files
+        algorithm: Hash algorithm (md5, sha1, sha256, etc.)
+        max_workers: Maximum number of files hashed at once
+
+    Returns:
+        Checksum for each path, in input order
+    """
+    paths = list(file_paths)
+    # Hashing releases the GIL, so threads overlap reads and hashing
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        checksums = executor.map(
+            lambda path: compute_file_checksum(path, algorithm), paths
+        )
+        return dict(zip(paths, checksums, strict=True))
+
+
 def validate_json_file(file_path: Path) -> dict[str, Any]:
     """
     Validate and load JSON file.
@@ -104,13 +246,17 @@ def validate_json_file(file_path: Path) -> dict[str, Any]:
     Raises:
         ValueError: If file is not valid JSON
     """
+    data = file_path.read_bytes()
     try:
-        with open(file_path) as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        parsed: dict[str, Any] = (
+            orjson.loads(data) if orjson is not None else json.loads(data)
+        )
+    except json.JSONDecodeError as e:  # orjson's error is a subclass
         raise ValueError(f"Invalid JSON in {file_path}: {e}") from e
+    return parsed
 
 
+@functools.lru_cache(maxsize=256)
 def validate_postgresql_type(pg_type: str) -> bool:
     """
     Check if PostgreSQL type is valid.
@@ -121,66 +267,7 @@ def validate_postgresql_type(pg_type: str) -> bool:
     Returns:
         True if valid type
     """
-    # Common PostgreSQL types
-    valid_types = {
-        # Numeric
-        "smallint",
-        "integer",
-        "int",
-        "bigint",
-        "decimal",
-        "numeric",
-        "real",
-        "double precision",
-        "smallserial",
-        "serial",
-        "bigserial",
-        # Monetary
-        "money",
-        # Character
-        "varchar",
-        "char",
-        "text",
-        # Binary
-        "bytea",
-        # Date/Time
-        "timestamp",
-        "timestamptz",
-        "timestamp with time zone",
-        "timestamp without time zone",
-        "date",
-        "time",
-        "timetz",
-        "interval",
-        # Boolean
-        "boolean",
-        "bool",
-        # Enumerated
-        "enum",
-        # Geometric
-        "point",
-        "line",
-        "lseg",
-        "box",
-        "path",
-        "polygon",
-        "circle",
-        # Network
-        "cidr",
-        "inet",
-        "macaddr",
-        # UUID
-        "uuid",
-        # JSON
-        "json",
-        "jsonb",
-        # Arrays (basic check)
-        "array",
-        # XML
-        "xml",
-    }
-
     # Extract base type (handle varchar(255), numeric(10,2), etc.)
-    base_type = pg_type.split("(")[0].strip().lower()
+    base_type = pg_type.partition("(")[0].strip().lower()
 
-    return base_type in valid_types
+    return base_type in _VALID_PG_TYPES
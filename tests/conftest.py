@@ -3,6 +3,31 @@
 
 import pytest
 
+from csv2pg_ai_schema_infer.sampler import sample_csv
+
+# Fixture file contents, encoded once at import. The CSV fixtures are
+# session-scoped, so tests must not modify the files they return.
+_SIMPLE_CSV = b"""id,name,age,email
+1,John Doe,25,john@example.com
+2,Jane Smith,32,jane@example.com
+3,Bob Johnson,28,bob@example.com
+"""
+
+_TYPES_CSV = b"""id,uuid_col,int_col,bigint_col,decimal_col,bool_col,date_col,timestamp_col,text_col
+1,550e8400-e29b-41d4-a716-446655440000,42,9223372036854775807,123.45,true,2024-01-15,2024-01-15T10:30:00,Hello World
+2,6ba7b810-9dad-11d1-80b4-00c04fd430c8,100,9223372036854775806,456.78,false,2024-01-16,2024-01-16T14:22:00,Test Data
+3,f47ac10b-58cc-4372-a567-0e02b2c3d479,200,9223372036854775805,789.01,true,2024-01-17,2024-01-17T09:15:00,Sample Text
+"""
+
+_UNICODE_CSV = """id,name,description
+1,François,Café ☕
+2,José,Piñata 🎉
+3,李明,你好世界 🌍
+""".encode()
+
+_EMPTY_CSV = b"""id,name,value
+"""
+
 
 @pytest.fixture
 def temp_output_dir(tmp_path):
@@ -12,50 +37,39 @@ def temp_output_dir(tmp_path):
     return output_dir
 
 
-@pytest.fixture
-def sample_csv_simple(tmp_path):
+@pytest.fixture(scope="session")
+def sample_csv_simple(tmp_path_factory):
     """Generate a simple test CSV."""
-    csv_path = tmp_path / "test_simple.csv"
-    content = """id,name,age,email
-1,John Doe,25,john@example.com
-2,Jane Smith,32,jane@example.com
-3,Bob Johnson,28,bob@example.com
-"""
-    csv_path.write_text(content)
+    csv_path = tmp_path_factory.mktemp("csv") / "test_simple.csv"
+    csv_path.write_bytes(_SIMPLE_CSV)
     return csv_path
 
 
-@pytest.fixture
-def sample_csv_types(tmp_path):
+@pytest.fixture(scope="session")
+def sample_csv_types(tmp_path_factory):
     """Generate CSV with various data types."""
-    csv_path = tmp_path / "test_types.csv"
-    content = """id,uuid_col,int_col,bigint_col,decimal_col,bool_col,date_col,timestamp_col,text_col
-1,550e8400-e29b-41d4-a716-446655440000,42,9223372036854775807,123.45,true,2024-01-15,2024-01-15T10:30:00,Hello World
-2,6ba7b810-9dad-11d1-80b4-00c04fd430c8,100,9223372036854775806,456.78,false,2024-01-16,2024-01-16T14:22:00,Test Data
-3,f47ac10b-58cc-4372-a567-0e02b2c3d479,200,9223372036854775805,789.01,true,2024-01-17,2024-01-17T09:15:00,Sample Text
-"""
-    csv_path.write_text(content)
+    csv_path = tmp_path_factory.mktemp("csv") / "test_types.csv"
+    csv_path.write_bytes(_TYPES_CSV)
     return csv_path
 
 
-@pytest.fixture
-def sample_csv_unicode(tmp_path):
+@pytest.fixture(scope="session")
+def sample_csv_unicode(tmp_path_factory):
     """Generate CSV with Unicode characters."""
-    csv_path = tmp_path / "test_unicode.csv"
-    content = """id,name,description
-1,François,Café ☕
-2,José,Piñata 🎉
-3,李明,你好世界 🌍
-"""
-    csv_path.write_text(content, encoding="utf-8")
+    csv_path = tmp_path_factory.mktemp("csv") / "test_unicode.csv"
+    csv_path.write_bytes(_UNICODE_CSV)
     return csv_path
 
 
-@pytest.fixture
-def sample_csv_empty(tmp_path):
+@pytest.fixture(scope="session")
+def sample_csv_empty(tmp_path_factory):
     """Generate an empty CSV."""
-    csv_path = tmp_path / "test_empty.csv"
-    content = """id,name,value
-"""
-    csv_path.write_text(content)
+    csv_path = tmp_path_factory.mktemp("csv") / "test_empty.csv"
+    csv_path.write_bytes(_EMPTY_CSV)
     return csv_path
+
+
+@pytest.fixture(scope="session")
+def sampled_simple(sample_csv_simple):
+    """Sample of the simple test CSV, parsed once per session."""
+    return sample_csv(sample_csv_simple)
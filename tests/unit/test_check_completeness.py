@@ -0,0 +1,39 @@
+"""Tests for the project completeness checker script."""
+
+import importlib.util
+from pathlib import Path
+
+_SCRIPT = Path(__file__).parents[2] / "scripts" / "check_completeness.py"
+
+# scripts/ is not a package, so the checker is loaded from its file
+_spec = importlib.util.spec_from_file_location("check_completeness", _SCRIPT)
+check_completeness = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(check_completeness)
+
+_MODULE = '''
+def top_level():
+    def nested():
+        pass
+
+
+class TopLevel:
+    class Inner:
+        pass
+
+    def method(self):
+        pass
+'''
+
+
+def test_only_top_level_definitions_count(tmp_path):
+    """Test that nested functions, methods and inner classes are not reported."""
+    module_path = tmp_path / "module.py"
+    module_path.write_text(_MODULE)
+    validator = check_completeness.ProjectValidator()
+    validator._cache_dir = tmp_path / "cache"
+
+    assert validator.check_function_exists(module_path, "top_level")
+    assert validator.check_class_exists(module_path, "TopLevel")
+    assert not validator.check_function_exists(module_path, "nested")
+    assert not validator.check_function_exists(module_path, "method")
+    assert not validator.check_class_exists(module_path, "Inner")
@@ -1,14 +1,19 @@
 """Tests for column chunker module."""
 
+from collections import Counter
+from itertools import chain
 
-from csv2pg_ai_schema_infer.chunker import chunk_columns, chunk_columns_smart
+from csv2pg_ai_schema_infer.chunker import (
+    auto_chunk_size,
+    chunk_columns,
+    chunk_columns_smart,
+)
 from csv2pg_ai_schema_infer.sampler import sample_csv
 
 
-def test_chunk_columns_basic(sample_csv_simple):
+def test_chunk_columns_basic(sampled_simple):
     """Test basic column chunking."""
-    sample = sample_csv(sample_csv_simple)
-    chunks = chunk_columns(sample, chunk_size=2)
+    chunks = chunk_columns(sampled_simple, chunk_size=2)
 
     assert len(chunks) == 2  # 4 columns / 2 = 2 chunks
     assert chunks[0].chunk_id == 0
@@ -17,26 +22,30 @@ def test_chunk_columns_basic(sample_csv_simple):
     assert len(chunks[1].columns) == 2
 
 
-def test_chunk_columns_all_in_one(sample_csv_simple):
+def test_chunk_sample_data_projected(sampled_simple):
+    """Test that each chunk carries column-wise samples for its own columns."""
+    chunks = chunk_columns(sampled_simple, chunk_size=2)
+
+    assert list(chunks[1].sample_data) == chunks[1].columns
+    assert chunks[1].sample_data["age"] == sampled_simple.columns["age"]
+
+
+def test_chunk_columns_all_in_one(sampled_simple):
     """Test chunking when all columns fit in one chunk."""
-    sample = sample_csv(sample_csv_simple)
-    chunks = chunk_columns(sample, chunk_size=10)
+    chunks = chunk_columns(sampled_simple, chunk_size=10)
 
     assert len(chunks) == 1
     assert len(chunks[0].columns) == 4
 
 
-def test_chunk_columns_smart(sample_csv_simple):
+def test_chunk_columns_smart(sampled_simple):
     """Test smart chunking."""
-    sample = sample_csv(sample_csv_simple)
-    chunks = chunk_columns_smart(sample, chunk_size=2)
+    chunks = chunk_columns_smart(sampled_simple, chunk_size=2)
 
     assert len(chunks) >= 1
     # Verify all columns are included
-    all_columns = []
-    for chunk in chunks:
-        all_columns.extend(chunk.columns)
-    assert sorted(all_columns) == sorted(sample.headers)
+    all_columns = list(chain.from_iterable(chunk.columns for chunk in chunks))
+    assert Counter(all_columns) == Counter(sampled_simple.headers)
 
 
 def test_chunk_columns_preserves_all(sample_csv_types):
@@ -44,9 +53,58 @@ def test_chunk_columns_preserves_all(sample_csv_types):
     sample = sample_csv(sample_csv_types)
     chunks = chunk_columns(sample, chunk_size=3)
 
-    all_columns = []
-    for chunk in chunks:
-        all_columns.extend(chunk.columns)
+    all_columns = list(chain.from_iterable(chunk.columns for chunk in chunks))
 
     assert len(all_columns) == len(sample.headers)
-    assert sorted(all_columns) == sorted(sample.headers)
+    assert Counter(all_columns) == Counter(sample.headers)
+
+
+def test_auto_chunk_size(sample_csv_simple, tmp_path):
+    """Test chunk size auto-tuning for narrow and wide CSVs."""
+    narrow = sample_csv(sample_csv_simple, encoding="utf-8")
+    assert auto_chunk_size(narrow, parallel_requests=4) == 20
+
+    wide_path = tmp_path / "wide.csv"
+    headers = [f"col_{i}" for i in range(120)]
+    rows = [",".join(str(i) for i in range(120)) for _ in range(3)]
+    wide_path.write_text("\n".join([",".join(headers), *rows]) + "\n")
+    wide = sample_csv(wide_path, encoding="utf-8")
+
+    assert auto_chunk_size(wide, parallel_requests=4) == 30
+    assert auto_chunk_size(wide, parallel_requests=1) == 120
+
+
+def test_auto_chunk_size_keeps_configured_size(tmp_path):
+    """Test that an explicitly configured chunk size is not auto-tuned."""
+    wide_path = tmp_path / "wide.csv"
+    headers = [f"col_{i}" for i in range(120)]
+    rows = [",".join(str(i) for i in range(120)) for _ in range(3)]
+    wide_path.write_text("\n".join([",".join(headers), *rows]) + "\n")
+    wide = sample_csv(wide_path, encoding="utf-8")
+
+    assert auto_chunk_size(wide, parallel_requests=4, configured=5) == 5
+    assert auto_chunk_size(wide, parallel_requests=4, configured=150) == 150
+    # Even the default size is kept when it was set explicitly
+    assert auto_chunk_size(wide, parallel_requests=4, configured=20) == 20
+
+
+def test_chunk_columns_smart_balanced(tmp_path):
+    """Test that smart chunking packs prefix groups into even chunks."""
+    csv_path = tmp_path / "groups.csv"
+    headers = [
+        *(f"a_{i}" for i in range(5)),
+        *(f"b_{i}" for i in range(3)),
+        *(f"c_{i}" for i in range(3)),
+        "d_0",
+    ]
+    csv_path.write_text(",".join(headers) + "\n" + ",".join("1" * len(headers)) + "\n")
+    sample = sample_csv(csv_path, encoding="utf-8")
+
+    chunks = chunk_columns_smart(sample, chunk_size=6)
+
+    assert [len(chunk.columns) for chunk in chunks] == [6, 6]
+    assert chunks[0].columns == [*(f"a_{i}" for i in range(5)), "d_0"]
+    assert chunks[1].columns == [
+        *(f"b_{i}" for i in range(3)),
+        *(f"c_{i}" for i in range(3)),
+    ]
@@ -0,0 +1,181 @@
+"""Tests for the Gemini LLM provider."""
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+from csv2pg_ai_schema_infer.inference import infer_schema_sync
+from csv2pg_ai_schema_infer.llm.gemini import GeminiProvider
+from csv2pg_ai_schema_infer.sampler import sample_csv
+from csv2pg_ai_schema_infer.types import ColumnChunk, ConfidenceLevel
+
+
+class FakeModel:
+    """Stand-in for a Gemini model that answers with canned column types."""
+
+    def __init__(self, types: dict[str, tuple[str, str]]):
+        self.types = types
+        self.calls: list[str] = []
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls.append(prompt)
+        columns = prompt.split("Columns to analyze: ", 1)[1].split("\n", 1)[0]
+        return SimpleNamespace(
+            text=json.dumps(
+                [
+                    {
+                        "column_name": col,
+                        "pg_type": self.types[col][0],
+                        "confidence": self.types[col][1],
+                        "reasoning": "fake",
+                        "nullable": True,
+                        "constraints": [],
+                        "cast_rule": None,
+                    }
+                    for col in columns.split(", ")
+                ]
+            )
+        )
+
+
+def test_fallback_model_rechecks_low_confidence():
+    """Test that only LOW confidence columns are sent to the fallback model."""
+    provider = GeminiProvider(api_key="test", fallback_model="fallback")
+    provider.model = FakeModel({"a": ("integer", "HIGH"), "b": ("text", "LOW")})
+    provider.fallback_model = FakeModel({"b": ("date", "HIGH")})
+    chunk = ColumnChunk(
+        chunk_id=0,
+        total_chunks=1,
+        columns=["a", "b"],
+        sample_data={"a": ["1"], "b": ["2024-01-02"]},
+    )
+
+    inferred = provider.infer_types_sync(chunk)
+
+    assert [(t.column_name, t.pg_type) for t in inferred] == [
+        ("a", "integer"),
+        ("b", "date"),
+    ]
+    assert inferred[1].confidence == ConfidenceLevel.HIGH
+    assert len(provider.fallback_model.calls) == 1
+    assert "Columns to analyze: b\n" in provider.fallback_model.calls[0]
+
+
+class SequenceModel:
+    """Stand-in for a Gemini model that returns canned response bodies in turn."""
+
+    def __init__(self, *bodies: list[dict]):
+        self.bodies = list(bodies)
+
+    def generate_content(self, prompt, **kwargs):
+        return SimpleNamespace(text=json.dumps(self.bodies.pop(0)))
+
+
+def test_malformed_response_is_retried(monkeypatch):
+    """Test that response items failing validation are rejected and retried."""
+    monkeypatch.setattr("csv2pg_ai_schema_infer.llm.gemini.time.sleep", lambda _: None)
+    item = {
+        "column_name": "a",
+        "pg_type": "integer",
+        "confidence": "HIGH",
+        "reasoning": "fake",
+        "nullable": True,
+        "constraints": [],
+        "cast_rule": None,
+    }
+    provider = GeminiProvider(api_key="test", retry_attempts=2)
+    provider.model = SequenceModel([{**item, "constraints": None}], [item])
+    chunk = ColumnChunk(
+        chunk_id=0, total_chunks=1, columns=["a"], sample_data={"a": ["1"]}
+    )
+
+    inferred = provider.infer_types_sync(chunk)
+
+    assert inferred[0].constraints == []
+    assert provider.model.bodies == []
+
+
+class HangingModel(FakeModel):
+    """Fake model whose call for the first chunk blocks until released."""
+
+    def __init__(self, first_column: str):
+        super().__init__({})
+        self.first_column = first_column
+        self.release = threading.Event()
+
+    def generate_content(self, prompt, **kwargs):
+        columns = prompt.split("Columns to analyze: ", 1)[1].split("\n", 1)[0]
+        if columns.split(", ")[0] == self.first_column:
+            self.release.wait(10)
+        self.types = dict.fromkeys(columns.split(", "), ("text", "HIGH"))
+        return super().generate_content(prompt, **kwargs)
+
+
+def test_timed_out_call_does_not_starve_later_chunks(sample_csv_types):
+    """Test that later chunks still run past an abandoned call."""
+    sample = sample_csv(sample_csv_types, encoding="utf-8")
+    provider = GeminiProvider(api_key="test")
+    provider.model = HangingModel(sample.headers[0])
+
+    try:
+        schema = infer_schema_sync(
+            sample,
+            provider,
+            chunk_size=3,
+            use_smart_chunking=False,
+            max_concurrency=1,
+            chunk_timeout=1,
+        )
+    finally:
+        provider.model.release.set()
+
+    types = {col.name: col.pg_type for col in schema.columns}
+    # The hung first chunk fell back to heuristics ...
+    assert types["uuid_col"] == "uuid"
+    # ... while the two chunks after it were still answered by the model
+    assert [types[name] for name in sample.headers[3:]] == ["text"] * 6
+
+
+# Runs inference in a child process with a model call that never returns
+_HUNG_CALL_SCRIPT = """
+import sys
+import threading
+from pathlib import Path
+
+from csv2pg_ai_schema_infer.inference import infer_schema_sync
+from csv2pg_ai_schema_infer.llm.gemini import GeminiProvider
+from csv2pg_ai_schema_infer.sampler import sample_csv
+
+
+class HungModel:
+    def generate_content(self, prompt, **kwargs):
+        threading.Event().wait()
+
+
+provider = GeminiProvider(api_key="test")
+provider.model = HungModel()
+schema = infer_schema_sync(
+    sample_csv(Path(sys.argv[1]), encoding="utf-8"), provider, chunk_timeout=0.5
+)
+print(len(schema.columns))
+"""
+
+
+def test_timed_out_call_does_not_block_exit(sample_csv_types):
+    """Test that a call abandoned by the chunk timeout doesn't keep the process alive."""
+    start = time.monotonic()
+    result = subprocess.run(
+        [sys.executable, "-c", _HUNG_CALL_SCRIPT, str(sample_csv_types)],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    elapsed = time.monotonic() - start
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == "9"
+    # Interpreter and SDK startup only; the hung call is never waited for
+    assert elapsed < 30
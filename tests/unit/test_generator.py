@@ -0,0 +1,53 @@
+"""Tests for generator module."""
+
+import pytest
+from jinja2 import Template, UndefinedError
+
+from csv2pg_ai_schema_infer import generator
+from csv2pg_ai_schema_infer.inference import infer_schema_heuristic
+
+# Renders its first line, then fails on an undefined variable
+_FAILING_TEMPLATE = Template("-- partial output\n{{ missing.attribute }}\n")
+
+
+def test_failed_render_keeps_existing_file(
+    sampled_simple, temp_output_dir, monkeypatch
+):
+    """Test that a render failing mid-stream leaves no truncated file behind."""
+    schema = infer_schema_heuristic(sampled_simple)
+    config_path = temp_output_dir / f"{schema.table_name}.load"
+    config_path.write_text("previous config\n")
+
+    monkeypatch.setattr(generator, "_get_template", lambda name: _FAILING_TEMPLATE)
+    with pytest.raises(UndefinedError):
+        generator.generate_pgloader_config(
+            schema, sampled_simple.path, temp_output_dir, "postgresql://localhost/db"
+        )
+
+    assert config_path.read_text() == "previous config\n"
+    assert sorted(p.name for p in temp_output_dir.iterdir()) == [config_path.name]
+
+
+def test_dry_run_still_renders_templates(sampled_simple, temp_output_dir, monkeypatch):
+    """Test that template errors surface on a dry run without writing files."""
+    schema = infer_schema_heuristic(sampled_simple)
+
+    result = generator.generate_all(
+        schema,
+        sampled_simple.path,
+        temp_output_dir,
+        "postgresql://localhost/db",
+        dry_run=True,
+    )
+    assert not result.pgloader_config_path.exists()
+    assert not result.import_script_path.exists()
+
+    monkeypatch.setattr(generator, "_get_template", lambda name: _FAILING_TEMPLATE)
+    with pytest.raises(UndefinedError):
+        generator.generate_all(
+            schema,
+            sampled_simple.path,
+            temp_output_dir,
+            "postgresql://localhost/db",
+            dry_run=True,
+        )
@@ -0,0 +1,146 @@
+"""Tests for type inference module."""
+
+import asyncio
+
+from csv2pg_ai_schema_infer import inference
+from csv2pg_ai_schema_infer.inference import (
+    heuristic_type_inference,
+    infer_schema_heuristic,
+    infer_schema_sync,
+)
+from csv2pg_ai_schema_infer.llm.base import LLMProvider
+from csv2pg_ai_schema_infer.sampler import sample_csv
+from csv2pg_ai_schema_infer.types import (
+    ColumnChunk,
+    ColumnSample,
+    ConfidenceLevel,
+    InferredType,
+)
+
+
+class FakeProvider(LLMProvider):
+    """LLM provider that types every column as text and tracks concurrency."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def infer_types(self, chunk: ColumnChunk) -> list[InferredType]:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return self.infer_types_sync(chunk)
+
+    def infer_types_sync(self, chunk: ColumnChunk) -> list[InferredType]:
+        return [
+            InferredType(
+                column_name=col,
+                pg_type="text",
+                confidence=ConfidenceLevel.HIGH,
+                reasoning="fake",
+            )
+            for col in chunk.columns
+        ]
+
+
+def test_infer_schema_max_concurrency(sample_csv_types):
+    """Test that concurrent LLM requests are capped."""
+    sample = sample_csv(sample_csv_types, encoding="utf-8")
+    provider = FakeProvider()
+
+    schema = infer_schema_sync(
+        sample, provider, chunk_size=1, use_smart_chunking=False, max_concurrency=2
+    )
+
+    assert [col.name for col in schema.columns] == sample.headers
+    assert provider.max_active == 2
+
+
+class HangingProvider(FakeProvider):
+    """LLM provider that never answers for the first chunk."""
+
+    async def infer_types(self, chunk: ColumnChunk) -> list[InferredType]:
+        if chunk.chunk_id == 0:
+            await asyncio.sleep(3600)
+        return self.infer_types_sync(chunk)
+
+
+def test_infer_schema_chunk_timeout(sample_csv_types):
+    """Test that a hung chunk times out and falls back to heuristics."""
+    sample = sample_csv(sample_csv_types, encoding="utf-8")
+
+    schema = infer_schema_sync(
+        sample,
+        HangingProvider(),
+        chunk_size=3,
+        use_smart_chunking=False,
+        chunk_timeout=0.05,
+    )
+
+    # Fallback columns keep their place in the schema
+    assert [col.name for col in schema.columns] == sample.headers
+    types = {col.name: col.pg_type for col in schema.columns}
+    # Columns from the hung chunk were typed by the heuristic fallback
+    assert types["uuid_col"] == "uuid"
+    assert types["bigint_col"] == "text"
+
+
+def test_infer_schema_heuristic_parallel(sample_csv_types, monkeypatch):
+    """Test that process-parallel heuristic inference matches the serial path."""
+    sample = sample_csv(sample_csv_types, encoding="utf-8")
+    serial = infer_schema_heuristic(sample)
+
+    monkeypatch.setattr(inference, "PARALLEL_HEURISTIC_MIN_COLUMNS", 1)
+    monkeypatch.setattr(inference.os, "cpu_count", lambda: 4)
+    parallel = infer_schema_heuristic(sample)
+
+    assert parallel == serial
+
+
+def test_heuristic_type_inference_patterns():
+    """Test heuristic type detection for common value patterns."""
+    cases = {
+        "uuid": ["123e4567-e89b-12d3-a456-426614174000"],
+        "boolean": ["true", "0", "N"],
+        "integer": ["12", "-5", "300"],
+        "bigint": ["3000000000", "1"],
+        "numeric": ["1.5", "2", "inf"],
+        "date": ["2024-01-02", "2023-12-31"],
+        "timestamptz": ["2024-01-02T10:11:12", "2024-01-02 10:11:12+00"],
+        "varchar(55)": ["hello", "world"],
+    }
+    for expected, values in cases.items():
+        column = ColumnSample(name="col", values=values, total_count=len(values))
+        assert heuristic_type_inference(column).pg_type == expected, values
+
+
+class FailingProvider(FakeProvider):
+    """LLM provider whose requests always fail."""
+
+    async def infer_types(self, chunk: ColumnChunk) -> list[InferredType]:
+        raise RuntimeError("LLM unavailable")
+
+
+def test_infer_schema_single_chunk(sample_csv_types):
+    """Test that a schema that fits in one chunk is inferred in one request."""
+    sample = sample_csv(sample_csv_types, encoding="utf-8")
+
+    schema = infer_schema_sync(sample, FakeProvider(), chunk_size=20)
+    assert [col.pg_type for col in schema.columns] == ["text"] * len(sample.headers)
+
+    # A failed single request still falls back to heuristics
+    schema = infer_schema_sync(sample, FailingProvider(), chunk_size=20)
+    assert schema == infer_schema_heuristic(sample)
+
+
+def test_infer_schema_fallback_unsanitized_headers(tmp_path):
+    """Test that fallback covers columns whose headers need sanitizing."""
+    csv_path = tmp_path / "mixed.csv"
+    csv_path.write_text("User ID,Sign-up Date\n1,2024-01-02\n2,2024-02-03\n")
+    sample = sample_csv(csv_path, encoding="utf-8")
+
+    schema = infer_schema_sync(sample, FailingProvider(), chunk_size=1)
+
+    types = {col.name: col.pg_type for col in schema.columns}
+    assert types == {"user_id": "integer", "sign_up_date": "date"}
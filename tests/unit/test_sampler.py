@@ -2,7 +2,12 @@
 
 import pytest
 
-from csv2pg_ai_schema_infer.sampler import detect_csv_properties, sample_csv
+from csv2pg_ai_schema_infer.sampler import (
+    detect_csv_properties,
+    estimate_row_count,
+    probe_csv,
+    sample_csv,
+)
 
 
 def test_sample_csv_simple(sample_csv_simple):
@@ -58,3 +63,40 @@ def test_detect_csv_properties(sample_csv_simple):
     assert properties.has_header is True
     assert properties.column_count == 4
     assert properties.encoding in ["utf-8", "ascii"]
+
+
+def test_sample_csv_columnar(sample_csv_simple):
+    """Test that sampled data is stored column-wise."""
+    sample = sample_csv(sample_csv_simple, n_rows=10, encoding="utf-8")
+
+    assert list(sample.columns) == sample.headers
+    assert sample.columns["name"] == ["John Doe", "Jane Smith", "Bob Johnson"]
+    assert sample.rows[0]["email"] == "john@example.com"
+
+
+def test_probe_csv(sample_csv_simple):
+    """Test probing properties and headers without sampling rows."""
+    properties, headers = probe_csv(sample_csv_simple, encoding="utf-8")
+
+    assert headers == ["id", "name", "age", "email"]
+    assert properties.delimiter == ","
+    assert properties.column_count == 4
+
+
+def test_sample_csv_null_counts(tmp_path):
+    """Test that null and blank values are counted per column."""
+    csv_path = tmp_path / "nulls.csv"
+    csv_path.write_text("a,b,c\n1, ,x\n,y,\n3,  ,z\n")
+
+    sample = sample_csv(csv_path, encoding="utf-8")
+
+    assert sample.null_counts == {"a": 1, "b": 2, "c": 1}
+
+
+def test_estimate_row_count(sample_csv_simple, tmp_path):
+    """Test exact counts for small files and extrapolation for large ones."""
+    assert estimate_row_count(sample_csv_simple) == 3
+
+    csv_path = tmp_path / "large.csv"
+    csv_path.write_text("id,value\n" + "".join(f"{i:05d},x\n" for i in range(1000)))
+    assert estimate_row_count(csv_path, sample_bytes=900) == 1000
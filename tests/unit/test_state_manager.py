@@ -0,0 +1,36 @@
+"""Tests for state manager module."""
+
+import os
+
+from csv2pg_ai_schema_infer.state_manager import StateManager
+from csv2pg_ai_schema_infer.utils.validation import compute_file_checksum, file_stat
+
+
+def test_known_checksum_reuses_unchanged_csv(sample_csv_simple, tmp_path):
+    """Test that a saved checksum is reused only while size and mtime match."""
+    manager = StateManager(tmp_path / "state.json")
+    csv_stat = file_stat(sample_csv_simple)
+    assert manager.known_checksum(sample_csv_simple, csv_stat) is None
+
+    state = manager.create_initial_state(sample_csv_simple, "test_simple")
+    manager.save_state(state)
+
+    assert state.csv_checksum == compute_file_checksum(sample_csv_simple)
+    assert manager.known_checksum(sample_csv_simple, csv_stat) == state.csv_checksum
+    size, mtime_ns = csv_stat
+    assert manager.known_checksum(sample_csv_simple, (size, mtime_ns + 1)) is None
+
+
+def test_can_resume_detects_changed_csv(tmp_path):
+    """Test that a changed CSV is re-hashed and rejected on resume."""
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(b"a,b\n1,2\n")
+    manager = StateManager(tmp_path / "state.json")
+    state = manager.create_initial_state(csv_path, "data")
+
+    csv_path.write_bytes(b"a,b\n1,3\n")
+    os.utime(csv_path, ns=(0, 0))
+
+    can_resume, reason = manager.can_resume(state, csv_path)
+    assert not can_resume
+    assert "checksum" in reason
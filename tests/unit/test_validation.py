@@ -0,0 +1,25 @@
+"""Tests for validation utilities."""
+
+import pytest
+
+from csv2pg_ai_schema_infer.utils.validation import (
+    compute_file_checksum,
+    compute_file_checksums,
+)
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "sha1", "md5", "blake2b", "sha512"])
+def test_compute_file_checksums(tmp_path, algorithm):
+    """Test that batch checksums match single-file checksums, in input order."""
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"file_{i}.csv"
+        path.write_bytes(f"id,value\n{i},{'x' * i}\n".encode())
+        paths.append(path)
+    paths.reverse()
+
+    checksums = compute_file_checksums(paths, algorithm, max_workers=2)
+
+    assert list(checksums) == paths
+    assert checksums == {p: compute_file_checksum(p, algorithm) for p in paths}
+    assert all(c.startswith(f"{algorithm}:") for c in checksums.values())